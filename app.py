@@ -14,13 +14,24 @@ Prof. V. Ravichandran
 import streamlit as st
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
 import plotly.graph_objects as go
-import plotly.express as px
-from arch import arch_model
+from scipy.stats import describe
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+import hashlib
+import logging
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import bottleneck as bn
+except ImportError:  # optional accelerator - fall back to pandas rolling
+    bn = None
+
+logger = logging.getLogger(__name__)
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # IMPORT CUSTOM MODULES
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -30,6 +41,444 @@ from styles import apply_main_styles
 from components import HeroHeader, SidebarNavigation, MetricsDisplay, TabsDisplay, Footer
 from data_fetcher import DataFetcher
 from volatility_models import VolatilityModels
+from numeric_kernels import NUMBA_AVAILABLE, prepare_returns
+from fast_garch import egarch11_loglik, garch11_loglik
+from fit_cache import load_or_fit
+from price_cache import invalidate as invalidate_price_cache, load_or_fetch
+from learning_content import render_learning_tab
+
+# Sidebar asset catalog (symbols resolve through DataFetcher.ASSET_MAPPING)
+ASSET_CATALOG = {
+    "Equity Indices": ("NIFTY 50 Index", "NIFTY Bank Index", "NIFTY IT Index"),
+    "Nifty Stocks": (
+        "TCS", "Infosys", "HDFC Bank", "ICICI Bank", "Reliance",
+        "Axis Bank", "Maruti", "ITC", "Bajaj Finance", "Wipro",
+        "Kotak Bank", "State Bank of India", "Larsen & Toubro"
+    ),
+    "International Indices": ("S&P 500", "NASDAQ", "Dow Jones", "Russell 2000"),
+    "Commodities": ("Gold", "Silver", "Crude Oil", "Natural Gas", "Copper"),
+}
+ASSET_CLASSES = tuple(ASSET_CATALOG)
+
+# First-load selection, also prefetched in the background on server start
+DEFAULT_ASSET = ASSET_CATALOG[ASSET_CLASSES[0]][0]
+DEFAULT_YEARS = 3
+
+# Daily -> annualized volatility scaling (252 trading days)
+SQRT_252 = math.sqrt(252.0)
+
+# Fitted arch results kept per model across reruns and sessions (bounded LRU)
+MAX_CACHED_FITS = 32
+
+# Plotly figures kept per (inputs) across reruns - rebuilt only when their inputs change
+MAX_CACHED_FIGURES = 32
+
+# Long price histories are thinned before plotting (browser render cost, not Python)
+PRICE_STRIDE_THRESHOLD = 1500
+PRICE_STRIDE = 5
+
+# Layout shared by every figure; time-series charts add a unified hover
+BASE_LAYOUT = {'template': 'plotly_white'}
+TIME_SERIES_LAYOUT = {**BASE_LAYOUT, 'hovermode': 'x unified'}
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CACHED DATA & MODEL HELPERS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@st.cache_resource(show_spinner=False)
+def get_http_session():
+    """One keep-alive HTTP session per process, reused by every Yahoo Finance fetch"""
+    try:
+        # Recent yfinance releases only accept curl_cffi sessions
+        from curl_cffi import requests as curl_requests
+        return curl_requests.Session(impersonate="chrome")
+    except ImportError:
+        import requests
+        return requests.Session()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_price_data(symbol: str, years: int):
+    """
+    Fetch price history from Yahoo Finance (cached for one hour per symbol/period)
+    
+    Only the Close column is kept: every cache hit unpickles a fresh copy, and the
+    app never reads Open/High/Low/Volume/Dividends/Stock Splits. Downloads are also
+    persisted to disk for a day, so a restarted server doesn't re-fetch them.
+    """
+    def fetch():
+        data = DataFetcher.fetch_stock_data(symbol, period=f"{years}y", session=get_http_session())
+        return None if data is None else data[['Close']]
+    
+    return load_or_fetch(symbol, years, fetch)
+
+@st.cache_resource(show_spinner=False)
+def prefetch_default_prices() -> threading.Thread:
+    """Warm the price cache for the default asset on a background thread (once per process)"""
+    ctx = get_script_run_ctx()
+    
+    def warm():
+        add_script_run_ctx(threading.current_thread(), ctx)
+        try:
+            load_price_data(DataFetcher.ASSET_MAPPING[DEFAULT_ASSET], DEFAULT_YEARS)
+        except Exception:
+            pass  # the foreground fetch retries and reports the error
+    
+    thread = threading.Thread(target=warm, daemon=True)
+    thread.start()
+    return thread
+
+@st.cache_resource(show_spinner=False)
+def warm_numeric_kernels() -> bool:
+    """
+    Run every Numba kernel once per process, so no user request pays for compilation
+    
+    prepare_returns compiles at import; the likelihood kernels compile on their first
+    call - or load from numba's on-disk cache after the first deploy.
+    """
+    if NUMBA_AVAILABLE:
+        prepare_returns(np.linspace(100.0, 101.0, 64), 20)
+        dummy_returns = np.random.default_rng(0).standard_normal(256)
+        garch11_loglik(np.array([0.0, 0.1, 0.05, 0.9]), dummy_returns, 1.0)
+        egarch11_loglik(np.array([0.0, 0.0, 0.1, 0.95]), dummy_returns, 0.0)
+    return NUMBA_AVAILABLE
+
+@st.cache_data(show_spinner=False)
+def prepare_return_series(close: pd.Series, window: int = 20):
+    """Daily log-returns (%), rolling volatility (array aligned with the returns) and return moments, memoized across reruns
+
+    One fused Numba pass when numba is installed, otherwise NumPy/bottleneck/scipy.
+    Moments: mean, std (ddof=1), bias-corrected skew/kurtosis, min, max and the
+    mean of the rolling volatility.
+    """
+    if NUMBA_AVAILABLE:
+        # np.array copies: a writable C-contiguous array matches the eager signature
+        # (pandas >= 3 copy-on-write hands out read-only views, which it rejects)
+        values, vol, mean, std, skew, kurt, lo, hi, vol_mean = prepare_returns(
+            np.array(close.to_numpy(dtype=np.float64)), window
+        )
+        returns = pd.Series(values, index=close.index[1:], name=close.name)
+    else:
+        returns = DataFetcher.calculate_returns(close, method="log")
+        values = returns.to_numpy()
+        if bn is not None:
+            vol = bn.move_std(values, window, min_count=window, ddof=1)
+        else:
+            vol = returns.rolling(window).std().to_numpy()
+        desc = describe(values, bias=False)
+        mean, std, skew, kurt = desc.mean, math.sqrt(desc.variance), desc.skewness, desc.kurtosis
+        lo, hi = desc.minmax
+        vol_mean = np.nanmean(vol)
+    
+    return_stats = {
+        'mean': float(mean), 'std': float(std), 'skew': float(skew),
+        'kurt': float(kurt), 'min': float(lo), 'max': float(hi),
+        'rolling_vol_mean': float(vol_mean),
+    }
+    return returns, vol, return_stats
+
+# arch parameter names -> display labels for the parameter tables
+GARCH_PARAMS = {
+    'omega': 'ω (Omega)',
+    'alpha[1]': 'α (Alpha)',
+    'beta[1]': 'β (Beta)',
+}
+EGARCH_PARAMS = {
+    **GARCH_PARAMS,
+    'gamma[1]': 'γ (Gamma)',
+}
+
+def format_param(val) -> str:
+    """Format a coefficient / std error for display ("N/A" when not estimated)"""
+    if val is None or pd.isna(val):
+        return "N/A"
+    return f"{float(val):.6f}"
+
+def build_params_table(results, param_labels: dict) -> pd.DataFrame:
+    """Coefficient / std-error table, pulled with one reindex per series"""
+    names = list(param_labels)
+    coef = results.params.reindex(names).to_numpy()
+    std_err = results.std_err.reindex(names).to_numpy()
+    return pd.DataFrame({
+        'Parameter': list(param_labels.values()),
+        'Coefficient': [format_param(v) for v in coef],
+        'Std Error': [format_param(v) for v in std_err]
+    })
+
+# Forecast tables keep raw floats; the 4-decimal rounding is display-only
+FORECAST_TABLE_COLUMNS = {
+    'Forecasted Volatility (%)': st.column_config.NumberColumn(format="%.4f"),
+}
+
+def build_forecast_table(forecast_index, forecast_ann, rows: int = 20) -> pd.DataFrame:
+    """First forecast dates and annualized volatilities, built straight from the arrays"""
+    return pd.DataFrame({
+        'Date': forecast_index[:rows],
+        'Forecasted Volatility (%)': forecast_ann[:rows],
+        'Confidence Level': '68%'
+    })
+
+def annualize_conditional_vol(cond_vol) -> np.ndarray:
+    """sqrt(cv) * sqrt(252) fused as sqrt(cv * 252): one buffer, square root taken in place"""
+    buf = np.multiply(np.asarray(cond_vol, dtype=np.float64), 252.0)
+    return np.sqrt(buf, out=buf)
+
+@st.cache_data(show_spinner=False)
+def compute_return_acfs(key: str, _returns_values: np.ndarray, nlags: int = 40):
+    """FFT autocorrelations of returns and squared returns, memoized on the returns digest"""
+    return (
+        VolatilityModels.compute_acf(_returns_values, nlags=nlags),
+        VolatilityModels.compute_acf(_returns_values, nlags=nlags, squared=True),
+    )
+
+@st.cache_resource(max_entries=MAX_CACHED_FIGURES, show_spinner=False)
+def build_acf_figure(key: str, title: str, n_obs: int, _acf_values: np.ndarray) -> go.Figure:
+    """Bar chart of autocorrelations with ±1.96/√N significance bounds"""
+    bound = 1.96 / math.sqrt(n_obs)
+    fig = go.Figure(go.Bar(
+        x=np.arange(_acf_values.size),
+        y=_acf_values,
+        name='ACF',
+        marker_color=COLORS['primary_light']
+    ))
+    fig.add_hline(y=bound, line_dash='dash', line_color=COLORS['accent_gold'])
+    fig.add_hline(y=-bound, line_dash='dash', line_color=COLORS['accent_gold'])
+    fig.update_layout(
+        title=title,
+        xaxis_title="Lag",
+        yaxis_title="Autocorrelation",
+        height=400,
+        showlegend=False,
+        **BASE_LAYOUT
+    )
+    return fig
+
+@st.cache_resource(max_entries=MAX_CACHED_FIGURES, show_spinner=False)
+def build_price_figure(key: str, selected_asset: str, years: int, _data: pd.DataFrame) -> go.Figure:
+    """Price history chart - WebGL trace, thinned to every 5th session for long histories"""
+    price_stride = PRICE_STRIDE if len(_data) > PRICE_STRIDE_THRESHOLD else 1
+    fig = go.Figure(go.Scattergl(
+        x=_data.index[::price_stride],
+        y=_data['Close'].to_numpy(dtype=np.float32)[::price_stride],
+        mode='lines',
+        name='Close Price',
+        line=dict(color=COLORS['primary_dark'], width=2)
+    ))
+    fig.update_layout(
+        title=f"{selected_asset} - Price History ({years} Years)",
+        xaxis_title="Date",
+        yaxis_title="Price",
+        height=400,
+        **TIME_SERIES_LAYOUT
+    )
+    return fig
+
+@st.cache_resource(max_entries=MAX_CACHED_FIGURES, show_spinner=False)
+def build_returns_histogram(key: str, selected_asset: str, _returns_values: np.ndarray) -> go.Figure:
+    """Returns distribution - binned server-side, only the 50 bar heights are sent"""
+    counts, edges = np.histogram(_returns_values, bins=50)
+    fig = go.Figure(go.Bar(
+        x=0.5 * (edges[:-1] + edges[1:]),
+        y=counts,
+        width=np.diff(edges),
+        marker_color=COLORS['primary_light']
+    ))
+    fig.update_layout(
+        title=f"{selected_asset} - Daily Returns Distribution",
+        xaxis_title="Daily Returns (%)",
+        yaxis_title="Frequency",
+        bargap=0,
+        height=400,
+        **BASE_LAYOUT
+    )
+    return fig
+
+@st.cache_resource(max_entries=MAX_CACHED_FIGURES, show_spinner=False)
+def build_forecast_figure(model_name: str, key: str, forecast_periods: int, selected_asset: str,
+                          _dates, _historical_vol: np.ndarray, _results, _forecast_ann, _forecast_index) -> go.Figure:
+    """Historical vs conditional volatility plus the annualized forecast for one model (traces sent as float32)"""
+    fig = go.Figure()
+    
+    # Historical volatility
+    fig.add_trace(go.Scattergl(
+        x=_dates,
+        y=_historical_vol.astype(np.float32),
+        mode='lines',
+        name='Historical Volatility (20-day)',
+        line=dict(color=COLORS['primary_dark'], width=2)
+    ))
+    
+    # Conditional volatility
+    fig.add_trace(go.Scattergl(
+        x=_dates,
+        y=annualize_conditional_vol(_results.conditional_volatility).astype(np.float32),
+        mode='lines',
+        name=f'{model_name} Conditional Vol',
+        line=dict(color=COLORS['primary_light'], width=2)
+    ))
+    
+    # Forecast
+    fig.add_trace(go.Scatter(
+        x=_forecast_index,
+        y=_forecast_ann.astype(np.float32),
+        mode='lines+markers',
+        name=f'{model_name} Forecast',
+        line=dict(color=COLORS['accent_gold'], width=3, dash='dash'),
+        marker=dict(size=8)
+    ))
+    
+    fig.update_layout(
+        title=f"{selected_asset} - {model_name} Volatility Forecast",
+        xaxis_title="Date",
+        yaxis_title="Annualized Volatility (%)",
+        height=500,
+        **TIME_SERIES_LAYOUT
+    )
+    return fig
+
+@st.cache_resource(max_entries=MAX_CACHED_FIGURES, show_spinner=False)
+def build_comparison_figure(key: str, forecast_periods: int, selected_asset: str,
+                            _forecast_index, _garch_fc_ann, _egarch_fc_ann) -> go.Figure:
+    """GARCH vs EGARCH annualized forecasts on one chart"""
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=_forecast_index,
+        y=_garch_fc_ann.astype(np.float32),
+        mode='lines+markers',
+        name='GARCH(1,1)',
+        line=dict(color=COLORS['primary_light'], width=3)
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=_forecast_index,
+        y=_egarch_fc_ann.astype(np.float32),
+        mode='lines+markers',
+        name='EGARCH(1,1)',
+        line=dict(color=COLORS['accent_gold'], width=3)
+    ))
+    
+    fig.update_layout(
+        title=f"{selected_asset} - GARCH vs EGARCH Forecast Comparison",
+        xaxis_title="Date",
+        yaxis_title="Annualized Volatility (%)",
+        height=500,
+        **TIME_SERIES_LAYOUT
+    )
+    return fig
+
+def returns_key(returns: pd.Series) -> str:
+    """Stable content hash of a returns series, used to key cached model fits"""
+    return hashlib.blake2b(returns.to_numpy().tobytes(), digest_size=16).hexdigest()
+
+def get_prepared_returns(close: pd.Series, window: int = 20):
+    """
+    (returns, returns values, returns digest, rolling vol, return stats) for a close series
+    
+    Kept in st.session_state under a digest of the prices, so an ordinary rerun
+    reuses the same objects instead of unpickling prepare_return_series' cached
+    copy (and re-hashing the prices and the returns) every time.
+    """
+    close_key = (returns_key(close), window)
+    prepared = st.session_state.get("prepared_returns")
+    
+    if prepared is None or prepared[0] != close_key:
+        returns, historical_vol, return_stats = prepare_return_series(close, window)
+        prepared = (close_key, returns, returns.to_numpy(), returns_key(returns), historical_vol, return_stats)
+        st.session_state["prepared_returns"] = prepared
+    
+    return prepared[1:]
+
+@st.cache_resource(max_entries=MAX_CACHED_FITS, ttl=3600, show_spinner=False)
+def fit_garch_cached(key: str, _returns: pd.Series, forecast_periods: int, _starting_values=None):
+    """Fit GARCH(1,1) once per returns series / horizon and keep the results object"""
+    return load_or_fit(
+        f"{key}_{forecast_periods}_garch",
+        lambda: VolatilityModels.fit_garch(
+            _returns,
+            forecast_periods=forecast_periods,
+            starting_values=_starting_values
+        )
+    )
+
+@st.cache_resource(max_entries=MAX_CACHED_FITS, ttl=3600, show_spinner=False)
+def fit_egarch_cached(key: str, _returns: pd.Series, forecast_periods: int, _starting_values=None):
+    """Fit EGARCH(1,1) once per returns series / horizon and keep the results object"""
+    return load_or_fit(
+        f"{key}_{forecast_periods}_egarch",
+        lambda: VolatilityModels.fit_egarch(
+            _returns,
+            forecast_periods=forecast_periods,
+            starting_values=_starting_values
+        )
+    )
+
+MODEL_FITTERS = {
+    "GARCH(1,1)": fit_garch_cached,
+    "EGARCH(1,1)": fit_egarch_cached,
+}
+
+def _store_model_fit(model_name: str, symbol: str, key: str, forecast_periods: int, fit_result):
+    """Record a fit in the session store (dropping stale inputs) and remember its warm start"""
+    fit_key = (model_name, key, forecast_periods)
+    fits = st.session_state.setdefault("model_fits", {})
+    
+    for stale_key in [k for k in fits if k[1:] != fit_key[1:]]:
+        del fits[stale_key]
+    results, forecast = fit_result
+    fits[fit_key] = (results, forecast, forecast * SQRT_252)  # annualized once per fit
+    st.session_state.setdefault("warm_starts", {})[(symbol, model_name)] = fit_result[0].params.to_numpy()
+
+def get_model_fit(model_name: str, symbol: str, key: str, returns: pd.Series, forecast_periods: int):
+    """
+    Return (results, forecast, annualized forecast) for a model, fitting at most once per session input
+    
+    Fits are stored in st.session_state under (model, returns hash, horizon) so the
+    comparison tab reads what Tabs 2/3 already produced. Entries for stale inputs
+    are dropped whenever a new fit is stored. The last estimated parameters per
+    (symbol, model) are kept as warm starts for the next fit of that asset.
+    """
+    fit_key = (model_name, key, forecast_periods)
+    fits = st.session_state.setdefault("model_fits", {})
+    
+    if fit_key not in fits:
+        warm_start = st.session_state.setdefault("warm_starts", {}).get((symbol, model_name))
+        _store_model_fit(
+            model_name, symbol, key, forecast_periods,
+            MODEL_FITTERS[model_name](key, returns, forecast_periods, warm_start)
+        )
+    
+    return fits[fit_key]
+
+def prefetch_model_fits(model_names, symbol: str, key: str, returns: pd.Series, forecast_periods: int):
+    """
+    Fit the listed models that aren't in the session store yet, concurrently
+    
+    The MLEs are independent, so wall-clock drops towards the slower of the two.
+    Threads (not processes) avoid pickling the returns and arch results; each worker
+    gets the script-run context so the cached fitters behave as on the main thread.
+    Failed fits are skipped here - the tab that needs them refits and reports the error.
+    """
+    fits = st.session_state.setdefault("model_fits", {})
+    warm_starts = st.session_state.setdefault("warm_starts", {})
+    missing = [m for m in model_names if (m, key, forecast_periods) not in fits]
+    
+    if len(missing) < 2:
+        return
+    
+    ctx = get_script_run_ctx()
+    
+    def fit(model_name):
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return MODEL_FITTERS[model_name](
+            key, returns, forecast_periods, warm_starts.get((symbol, model_name))
+        )
+    
+    with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+        futures = {model_name: pool.submit(fit, model_name) for model_name in missing}
+    
+    for model_name, future in futures.items():
+        if future.exception() is None:
+            _store_model_fit(model_name, symbol, key, forecast_periods, future.result())
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # PAGE CONFIGURATION
@@ -42,6 +491,11 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Start downloading the default asset while the header and sidebar render,
+# and pay the kernel compile cost while that download is in flight
+prefetch_default_prices()
+warm_numeric_kernels()
+
 # Apply custom styles from template
 apply_main_styles()
 
@@ -76,10 +530,10 @@ with st.sidebar:
     st.markdown("**Asset Class:**")
     asset_type = st.selectbox(
         label="Asset Class",
-        options=["Equity Indices", "Nifty Stocks", "International Indices", "Commodities"],
+        options=ASSET_CLASSES,
         help="Choose asset class",
         key="asset_class_selector",
-        index=["Equity Indices", "Nifty Stocks", "International Indices", "Commodities"].index(st.session_state.last_asset_class),
+        index=ASSET_CLASSES.index(st.session_state.last_asset_class),
         label_visibility="collapsed"
     )
     
@@ -88,30 +542,8 @@ with st.sidebar:
         st.session_state.last_asset_class = asset_type
         st.session_state.selected_asset_index = 0
     
-    # Asset choice based on class
-    if asset_type == "Equity Indices":
-        available_assets = ["NIFTY 50 Index", "NIFTY Bank Index", "NIFTY IT Index"]
-        symbols = ["^NSEI", "^NSEBANK", "^CNXIT"]
-    
-    elif asset_type == "Nifty Stocks":
-        available_assets = [
-            "TCS", "Infosys", "HDFC Bank", "ICICI Bank", "Reliance", 
-            "Axis Bank", "Maruti", "ITC", "Bajaj Finance", "Wipro",
-            "Kotak Bank", "State Bank of India", "Larsen & Toubro"
-        ]
-        symbols = [
-            "TCS.NS", "INFY.NS", "HDFCBANK.NS", "ICICIBANK.NS", "RELIANCE.NS",
-            "AXISBANK.NS", "MARUTI.NS", "ITC.NS", "BAJAJFINSV.NS", "WIPRO.NS",
-            "KOTAKBANK.NS", "SBIN.NS", "LT.NS"
-        ]
-    
-    elif asset_type == "International Indices":
-        available_assets = ["S&P 500", "NASDAQ", "Dow Jones", "Russell 2000"]
-        symbols = ["^GSPC", "^IXIC", "^DJI", "^RUT"]
-    
-    else:  # Commodities
-        available_assets = ["Gold", "Silver", "Crude Oil", "Natural Gas", "Copper"]
-        symbols = ["GC=F", "SI=F", "CL=F", "NG=F", "HG=F"]
+    # Asset choice based on class - names from the catalog, symbols via DataFetcher
+    available_assets = ASSET_CATALOG[asset_type]
     
     # Ensure selected index is valid
     if st.session_state.selected_asset_index >= len(available_assets):
@@ -131,8 +563,7 @@ with st.sidebar:
     # Update selected index
     st.session_state.selected_asset_index = available_assets.index(selected_asset)
     
-    asset_index = available_assets.index(selected_asset)
-    symbol = symbols[asset_index]
+    symbol = DataFetcher.ASSET_MAPPING[selected_asset]
     
     st.markdown("---")
     
@@ -146,24 +577,38 @@ with st.sidebar:
         label_visibility="collapsed"
     )
     
+    # Exact matches - "GARCH(1,1)" is a substring of "EGARCH(1,1)"
+    need_garch = models in ("GARCH(1,1)", "Both")
+    need_egarch = models in ("EGARCH(1,1)", "Both")
+    need_comparison = models == "Both"
+    
     st.markdown("---")
     
     # Period selection
     st.write("### ⏱️ TIME PERIOD")
-    years = st.slider("**Years of Historical Data:**", 1, 10, 3, help="Historical data for model training", key="years_slider")
+    years = st.slider("**Years of Historical Data:**", 1, 10, DEFAULT_YEARS, help="Historical data for model training", key="years_slider")
     
     forecast_days = st.slider("**Forecast Period (Days):**", 5, 60, 20, help="Number of days to forecast", key="forecast_days_slider")
     
+    # Prices are cached in memory for an hour and on disk for up to a day -
+    # allow a manual refresh from Yahoo Finance
+    if st.button("🔄 Refresh Market Data", help="Discard cached prices and re-download", use_container_width=True):
+        invalidate_price_cache(symbol, years)
+        load_price_data.clear()
+    
     st.markdown("---")
     
     # Configuration info
     with st.expander("⚙️ Selected Configuration"):
-        st.markdown(f"**Asset Class:** <span style='color: #DC3545; font-weight: 700;'>{asset_type}</span>", unsafe_allow_html=True)
-        st.markdown(f"**Selected Asset:** <span style='color: #DC3545; font-weight: 700;'>{selected_asset}</span>", unsafe_allow_html=True)
-        st.markdown(f"**Symbol:** <span style='color: #DC3545; font-weight: 700; font-family: monospace;'>{symbol}</span>", unsafe_allow_html=True)
-        st.markdown(f"**Years:** <span style='color: #DC3545; font-weight: 700;'>{years}</span>", unsafe_allow_html=True)
-        st.markdown(f"**Forecast Days:** <span style='color: #DC3545; font-weight: 700;'>{forecast_days}</span>", unsafe_allow_html=True)
-        st.markdown(f"**Models:** <span style='color: #DC3545; font-weight: 700;'>{models}</span>", unsafe_allow_html=True)
+        # One markdown element; Streamlit's :red[] colour directive replaces the inline HTML
+        st.markdown(
+            f"**Asset Class:** :red[**{asset_type}**]  \n"
+            f"**Selected Asset:** :red[**{selected_asset}**]  \n"
+            f"**Symbol:** `{symbol}`  \n"
+            f"**Years:** :red[**{years}**]  \n"
+            f"**Forecast Days:** :red[**{forecast_days}**]  \n"
+            f"**Models:** :red[**{models}**]"
+        )
     
     st.markdown("---")
     st.write("**About This Tool**")
@@ -187,7 +632,7 @@ data_fetch_placeholder = st.empty()
 with data_fetch_placeholder.container():
     with st.spinner(f"📊 Fetching {selected_asset} ({symbol}) data..."):
         try:
-            data = DataFetcher.fetch_stock_data(symbol, period=f"{years}y")
+            data = load_price_data(symbol, years)
             
             if data is None:
                 st.error(f"❌ No data available for {selected_asset} ({symbol}). Please try another asset.")
@@ -201,7 +646,13 @@ with data_fetch_placeholder.container():
                     st.stop()
             
             # Calculate returns
-            returns = np.log(data['Close'] / data['Close'].shift(1)).dropna() * 100
+            returns, returns_values, returns_hash, historical_vol, return_stats = get_prepared_returns(data['Close'], 20)
+            
+            # Forecast dates shared by Tabs 2, 3 and 4 - trading (business) days only
+            forecast_index = pd.bdate_range(
+                start=data.index[-1] + pd.Timedelta(days=1),
+                periods=forecast_days
+            )
             
             st.success(f"✅ Loaded {len(data)} trading days for {selected_asset}")
             
@@ -214,23 +665,20 @@ with data_fetch_placeholder.container():
 # MODEL FITTING & FORECASTING
 # ═══════════════════════════════════════════════════════════════════════════════
 
-col1, col2, col3, col4 = st.columns(4)
-
-with col1:
-    current_volatility = returns.std()
-    st.metric("Current Volatility", f"{current_volatility:.4f}%")
-
-with col2:
-    annual_volatility = current_volatility * np.sqrt(252)
-    st.metric("Annualized Volatility", f"{annual_volatility:.2f}%")
-
-with col3:
-    mean_return = returns.mean()
-    st.metric("Mean Daily Return", f"{mean_return:.4f}%")
-
-with col4:
-    sharpe_ratio = (returns.mean() * 252) / (returns.std() * np.sqrt(252))
-    st.metric("Sharpe Ratio", f"{sharpe_ratio:.2f}")
+# Moments come from the cached data-prep pass; everything else is derived from them
+mean_return = return_stats['mean']
+current_volatility = return_stats['std']
+annual_volatility = current_volatility * SQRT_252
+sharpe_ratio = mean_return * SQRT_252 / current_volatility  # (252 * mean) / (√252 * std)
+
+summary_metrics = (
+    ("Current Volatility", f"{current_volatility:.4f}%"),
+    ("Annualized Volatility", f"{annual_volatility:.2f}%"),
+    ("Mean Daily Return", f"{mean_return:.4f}%"),
+    ("Sharpe Ratio", f"{sharpe_ratio:.2f}"),
+)
+for col, (label, value) in zip(st.columns(len(summary_metrics)), summary_metrics):
+    col.metric(label, value)
 
 st.markdown("---")
 
@@ -238,72 +686,65 @@ st.markdown("---")
 # TABS FOR DIFFERENT ANALYSIS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+# st.tabs runs every tab body on each rerun - a radio selector renders only the chosen view
+VIEWS = (
     "📊 Price & Returns",
     "🔮 GARCH(1,1) Forecast",
     "⚡ EGARCH(1,1) Forecast",
     "📈 Model Comparison",
     "📋 Statistics",
     "📚 Learning & Theory"
-])
+)
+view = st.radio("View", VIEWS, horizontal=True, key="view_selector", label_visibility="collapsed")
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # TAB 1: PRICE & RETURNS VISUALIZATION
 # ═══════════════════════════════════════════════════════════════════════════════
 
-with tab1:
+@st.fragment
+def render_price_tab(data, returns_values, returns_hash, selected_asset, years):
+    """Tab 1: price history and returns distribution (isolated fragment)"""
     st.markdown("#### 📊 Price History & Returns Analysis")
     
     col1, col2 = st.columns(2)
     
     with col1:
-        # Price chart
-        fig_price = go.Figure()
-        fig_price.add_trace(go.Scatter(
-            x=data.index,
-            y=data['Close'],
-            mode='lines',
-            name='Close Price',
-            line=dict(color=COLORS['primary_dark'], width=2)
-        ))
-        fig_price.update_layout(
-            title=f"{selected_asset} - Price History ({years} Years)",
-            xaxis_title="Date",
-            yaxis_title="Price",
-            hovermode='x unified',
-            height=400,
-            template='plotly_white'
+        # Figures are memoized on the data digest - reruns reuse the built objects
+        st.plotly_chart(
+            build_price_figure(returns_hash, selected_asset, years, data),
+            use_container_width=True
         )
-        st.plotly_chart(fig_price, use_container_width=True)
     
     with col2:
-        # Returns distribution
-        fig_returns = px.histogram(
-            x=returns,
-            nbins=50,
-            title=f"{selected_asset} - Daily Returns Distribution",
-            labels={'x': 'Daily Returns (%)', 'y': 'Frequency'},
-            color_discrete_sequence=[COLORS['primary_light']]
+        st.plotly_chart(
+            build_returns_histogram(returns_hash, selected_asset, returns_values),
+            use_container_width=True
         )
-        fig_returns.update_layout(height=400, template='plotly_white')
-        st.plotly_chart(fig_returns, use_container_width=True)
+
+if view == VIEWS[0]:
+    render_price_tab(data, returns_values, returns_hash, selected_asset, years)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # TAB 2: GARCH(1,1) FORECAST
 # ═══════════════════════════════════════════════════════════════════════════════
 
-with tab2:
+@st.fragment
+def render_garch_tab(returns, historical_vol, symbol, returns_hash, forecast_days, forecast_index, selected_asset, need_garch):
+    """Tab 2: GARCH(1,1) fit, parameters and volatility forecast (isolated fragment)"""
     # Check if GARCH is selected
-    if "GARCH(1,1)" not in models and "Both" not in models:
+    if not need_garch:
         st.info("ℹ️ **GARCH(1,1) model not selected.** Please select 'GARCH(1,1)' or 'Both' in the sidebar to view this analysis.")
     else:
         st.markdown("#### 🔮 GARCH(1,1) Model Analysis & Forecast")
         
         with st.spinner("⏳ Fitting GARCH(1,1) model..."):
             try:
-                garch_results, garch_forecast = VolatilityModels.fit_garch(
-                    returns, 
-                    forecast_periods=forecast_days
+                garch_results, garch_forecast, garch_fc_ann = get_model_fit(
+                    "GARCH(1,1)",
+                    symbol,
+                    returns_hash,
+                    returns,
+                    forecast_days
                 )
                 
                 col1, col2, col3 = st.columns(3)
@@ -315,141 +756,60 @@ with tab2:
                 with col3:
                     st.metric("Log-Likelihood", f"{garch_results.loglikelihood:.2f}")
                 
-                # Model parameters - SAFE EXTRACTION WITH BETTER LOGIC
+                # Model parameters - one vectorized pull by arch parameter name
                 st.markdown("**Model Parameters:**")
                 try:
-                    params = garch_results.params
-                    std_err = garch_results.std_err
-                    
-                    print(f"DEBUG - Available GARCH params: {list(params.index)}")
-                    
-                    # Get Omega - try multiple names and first position
-                    omega = None
-                    omega_se = None
-                    for key in ['Constant', 'const', 'mu']:
-                        if key in params:
-                            omega = float(params[key])
-                            omega_se = float(std_err[key])
-                            break
-                    
-                    if omega is None and len(params) > 0:
-                        try:
-                            omega = float(params.iloc[0])
-                            omega_se = float(std_err.iloc[0])
-                        except:
-                            pass
-                    
-                    # Get Alpha
-                    alpha = None
-                    alpha_se = None
-                    for key in params.index:
-                        if 'alpha' in str(key).lower():
-                            alpha = float(params[key])
-                            alpha_se = float(std_err[key])
-                            break
-                    
-                    # Get Beta
-                    beta = None
-                    beta_se = None
-                    for key in params.index:
-                        if 'beta' in str(key).lower():
-                            beta = float(params[key])
-                            beta_se = float(std_err[key])
-                            break
-                    
-                    # Format values for display
-                    def format_param(val):
-                        if val is None or pd.isna(val):
-                            return "N/A"
-                        return f"{float(val):.6f}"
-                    
-                    params_garch = pd.DataFrame({
-                        'Parameter': ['ω (Omega)', 'α (Alpha)', 'β (Beta)'],
-                        'Coefficient': [format_param(omega), format_param(alpha), format_param(beta)],
-                        'Std Error': [format_param(omega_se), format_param(alpha_se), format_param(beta_se)]
-                    })
+                    params_garch = build_params_table(garch_results, GARCH_PARAMS)
                     st.dataframe(params_garch, use_container_width=True)
                 except Exception as param_error:
                     st.info(f"⚠️ Parameter extraction issue: {str(param_error)}")
-                    print(f"Parameter extraction error: {param_error}")
+                    logger.warning("GARCH parameter extraction error: %s", param_error)
                 
                 # Forecast visualization
                 st.markdown("**Volatility Forecast:**")
                 
-                forecast_index = pd.date_range(
-                    start=data.index[-1],
-                    periods=forecast_days + 1,
-                    freq='D'
-                )[1:]
-                
-                fig_garch = go.Figure()
-                
-                # Historical volatility
-                historical_vol = returns.rolling(20).std()
-                fig_garch.add_trace(go.Scatter(
-                    x=historical_vol.index,
-                    y=historical_vol,
-                    mode='lines',
-                    name='Historical Volatility (20-day)',
-                    line=dict(color=COLORS['primary_dark'], width=2)
-                ))
-                
-                # Conditional volatility
-                fig_garch.add_trace(go.Scatter(
-                    x=data.index,
-                    y=np.sqrt(garch_results.conditional_volatility) * np.sqrt(252),
-                    mode='lines',
-                    name='GARCH(1,1) Conditional Vol',
-                    line=dict(color=COLORS['primary_light'], width=2)
-                ))
-                
-                # Forecast
-                fig_garch.add_trace(go.Scatter(
-                    x=forecast_index,
-                    y=garch_forecast * np.sqrt(252),
-                    mode='lines+markers',
-                    name='GARCH(1,1) Forecast',
-                    line=dict(color=COLORS['accent_gold'], width=3, dash='dash'),
-                    marker=dict(size=8)
-                ))
-                
-                fig_garch.update_layout(
-                    title=f"{selected_asset} - GARCH(1,1) Volatility Forecast",
-                    xaxis_title="Date",
-                    yaxis_title="Annualized Volatility (%)",
-                    hovermode='x unified',
-                    height=500,
-                    template='plotly_white'
+                st.plotly_chart(
+                    build_forecast_figure(
+                        "GARCH(1,1)", returns_hash, forecast_days, selected_asset,
+                        returns.index, historical_vol, garch_results, garch_fc_ann, forecast_index
+                    ),
+                    use_container_width=True
                 )
-                st.plotly_chart(fig_garch, use_container_width=True)
                 
                 # Forecast table
                 st.markdown("**Forecast Values (Next 20 days):**")
-                forecast_df = pd.DataFrame({
-                    'Date': forecast_index[:20],
-                    'Forecasted Volatility (%)': (garch_forecast[:20] * np.sqrt(252)).round(4),
-                    'Confidence Level': '68%'
-                })
-                st.dataframe(forecast_df, use_container_width=True)
+                st.dataframe(
+                    build_forecast_table(forecast_index, garch_fc_ann),
+                    column_config=FORECAST_TABLE_COLUMNS,
+                    use_container_width=True
+                )
             except Exception as e:
                 st.error(f"❌ Error fitting GARCH model: {str(e)}")
 
+if view == VIEWS[1]:
+    render_garch_tab(returns, historical_vol, symbol, returns_hash, forecast_days, forecast_index, selected_asset, need_garch)
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # TAB 3: EGARCH(1,1) FORECAST
 # ═══════════════════════════════════════════════════════════════════════════════
 
-with tab3:
+@st.fragment
+def render_egarch_tab(returns, historical_vol, symbol, returns_hash, forecast_days, forecast_index, selected_asset, need_egarch):
+    """Tab 3: EGARCH(1,1) fit, parameters and volatility forecast (isolated fragment)"""
     # Check if EGARCH is selected
-    if "EGARCH(1,1)" not in models and "Both" not in models:
+    if not need_egarch:
         st.info("ℹ️ **EGARCH(1,1) model not selected.** Please select 'EGARCH(1,1)' or 'Both' in the sidebar to view this analysis.")
     else:
         st.markdown("#### ⚡ EGARCH(1,1) Model Analysis & Forecast")
         
         with st.spinner("⏳ Fitting EGARCH(1,1) model..."):
             try:
-                egarch_results, egarch_forecast = VolatilityModels.fit_egarch(
+                egarch_results, egarch_forecast, egarch_fc_ann = get_model_fit(
+                    "EGARCH(1,1)",
+                    symbol,
+                    returns_hash,
                     returns,
-                    forecast_periods=forecast_days
+                    forecast_days
                 )
                 
                 col1, col2, col3 = st.columns(3)
@@ -461,75 +821,12 @@ with tab3:
                 with col3:
                     st.metric("Log-Likelihood", f"{egarch_results.loglikelihood:.2f}")
                 
-                # Model parameters - SAFE EXTRACTION WITH BETTER LOGIC
+                # Model parameters - one vectorized pull by arch parameter name
                 st.markdown("**Model Parameters:**")
                 try:
-                    params = egarch_results.params
-                    std_err = egarch_results.std_err
-                    
-                    print(f"DEBUG - Available EGARCH params: {list(params.index)}")
-                    
-                    # Get Omega - try multiple names and first position
-                    omega = None
-                    omega_se = None
-                    for key in ['Constant', 'const', 'mu']:
-                        if key in params:
-                            omega = float(params[key])
-                            omega_se = float(std_err[key])
-                            break
-                    
-                    if omega is None and len(params) > 0:
-                        try:
-                            omega = float(params.iloc[0])
-                            omega_se = float(std_err.iloc[0])
-                        except:
-                            pass
-                    
-                    # Get Alpha
-                    alpha = None
-                    alpha_se = None
-                    for key in params.index:
-                        if 'alpha' in str(key).lower():
-                            alpha = float(params[key])
-                            alpha_se = float(std_err[key])
-                            break
-                    
-                    # Get Beta
-                    beta = None
-                    beta_se = None
-                    for key in params.index:
-                        if 'beta' in str(key).lower():
-                            beta = float(params[key])
-                            beta_se = float(std_err[key])
-                            break
-                    
-                    # Get Gamma - try multiple variations
-                    gamma = None
-                    gamma_se = None
-                    for key in params.index:
-                        key_lower = str(key).lower()
-                        # Try multiple possible gamma names
-                        if any(g in key_lower for g in ['gamma', 'leverage', 'asymmetry']):
-                            try:
-                                gamma = float(params[key])
-                                gamma_se = float(std_err[key])
-                                print(f"Found Gamma as: {key}")
-                                break
-                            except:
-                                continue
-                    
-                    # Format values for display
-                    def format_param(val):
-                        if val is None or pd.isna(val):
-                            return "N/A"
-                        return f"{float(val):.6f}"
-                    
-                    params_egarch = pd.DataFrame({
-                        'Parameter': ['ω (Omega)', 'α (Alpha)', 'β (Beta)', 'γ (Gamma)'],
-                        'Coefficient': [format_param(omega), format_param(alpha), format_param(beta), format_param(gamma)],
-                        'Std Error': [format_param(omega_se), format_param(alpha_se), format_param(beta_se), format_param(gamma_se)]
-                    })
+                    params_egarch = build_params_table(egarch_results, EGARCH_PARAMS)
                     st.dataframe(params_egarch, use_container_width=True)
+                    gamma = egarch_results.params.get('gamma[1]')
                     
                     # Show different note based on whether Gamma was estimated
                     if gamma is None:
@@ -538,611 +835,173 @@ with tab3:
                         st.info("💡 **Note:** γ (Gamma) parameter captures asymmetric effects (leverage effect) - negative shocks have larger impact on volatility than positive shocks")
                 except Exception as param_error:
                     st.info(f"⚠️ Parameter extraction issue: {str(param_error)}")
-                    print(f"EGARCH param error: {param_error}")
+                    logger.warning("EGARCH parameter extraction error: %s", param_error)
                 
                 # Forecast visualization
                 st.markdown("**Volatility Forecast:**")
                 
-                forecast_index = pd.date_range(
-                    start=data.index[-1],
-                    periods=forecast_days + 1,
-                    freq='D'
-                )[1:]
-                
-                fig_egarch = go.Figure()
-                
-                # Historical volatility
-                historical_vol = returns.rolling(20).std()
-                fig_egarch.add_trace(go.Scatter(
-                    x=historical_vol.index,
-                    y=historical_vol,
-                    mode='lines',
-                    name='Historical Volatility (20-day)',
-                    line=dict(color=COLORS['primary_dark'], width=2)
-                ))
-                
-                # Conditional volatility
-                fig_egarch.add_trace(go.Scatter(
-                    x=data.index,
-                    y=np.sqrt(egarch_results.conditional_volatility) * np.sqrt(252),
-                    mode='lines',
-                    name='EGARCH(1,1) Conditional Vol',
-                    line=dict(color=COLORS['primary_light'], width=2)
-                ))
-                
-                # Forecast
-                fig_egarch.add_trace(go.Scatter(
-                    x=forecast_index,
-                    y=egarch_forecast * np.sqrt(252),
-                    mode='lines+markers',
-                    name='EGARCH(1,1) Forecast',
-                    line=dict(color=COLORS['accent_gold'], width=3, dash='dash'),
-                    marker=dict(size=8)
-                ))
-                
-                fig_egarch.update_layout(
-                    title=f"{selected_asset} - EGARCH(1,1) Volatility Forecast",
-                    xaxis_title="Date",
-                    yaxis_title="Annualized Volatility (%)",
-                    hovermode='x unified',
-                    height=500,
-                    template='plotly_white'
+                st.plotly_chart(
+                    build_forecast_figure(
+                        "EGARCH(1,1)", returns_hash, forecast_days, selected_asset,
+                        returns.index, historical_vol, egarch_results, egarch_fc_ann, forecast_index
+                    ),
+                    use_container_width=True
                 )
-                st.plotly_chart(fig_egarch, use_container_width=True)
                 
                 # Forecast table
                 st.markdown("**Forecast Values (Next 20 days):**")
-                forecast_df = pd.DataFrame({
-                    'Date': forecast_index[:20],
-                    'Forecasted Volatility (%)': (egarch_forecast[:20] * np.sqrt(252)).round(4),
-                    'Confidence Level': '68%'
-                })
-                st.dataframe(forecast_df, use_container_width=True)
+                st.dataframe(
+                    build_forecast_table(forecast_index, egarch_fc_ann),
+                    column_config=FORECAST_TABLE_COLUMNS,
+                    use_container_width=True
+                )
             except Exception as e:
                 st.error(f"❌ Error fitting EGARCH model: {str(e)}")
 
+if view == VIEWS[2]:
+    render_egarch_tab(returns, historical_vol, symbol, returns_hash, forecast_days, forecast_index, selected_asset, need_egarch)
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # TAB 4: MODEL COMPARISON
 # ═══════════════════════════════════════════════════════════════════════════════
 
-with tab4:
-    st.markdown("#### 📈 GARCH vs EGARCH Comparison")
-    
-    with st.spinner("⏳ Comparing models..."):
-        try:
-            garch_results, garch_forecast = VolatilityModels.fit_garch(returns, forecast_days)
-            egarch_results, egarch_forecast = VolatilityModels.fit_egarch(returns, forecast_days)
-            
-            # Model comparison metrics
-            st.markdown("**Model Performance Metrics:**")
-            
-            comparison_df = pd.DataFrame({
-                'Metric': ['AIC', 'BIC', 'Log-Likelihood'],
-                'GARCH(1,1)': [
-                    f"{garch_results.aic:.2f}",
-                    f"{garch_results.bic:.2f}",
-                    f"{garch_results.loglikelihood:.2f}"
-                ],
-                'EGARCH(1,1)': [
-                    f"{egarch_results.aic:.2f}",
-                    f"{egarch_results.bic:.2f}",
-                    f"{egarch_results.loglikelihood:.2f}"
-                ]
-            })
-            st.dataframe(comparison_df, use_container_width=True)
-            
-            # Forecast comparison
-            st.markdown("**Forecast Comparison:**")
-            
-            forecast_index = pd.date_range(
-                start=data.index[-1],
-                periods=forecast_days + 1,
-                freq='D'
-            )[1:]
-            
-            fig_compare = go.Figure()
-            
-            fig_compare.add_trace(go.Scatter(
-                x=forecast_index,
-                y=garch_forecast * np.sqrt(252),
-                mode='lines+markers',
-                name='GARCH(1,1)',
-                line=dict(color=COLORS['primary_light'], width=3)
-            ))
-            
-            fig_compare.add_trace(go.Scatter(
-                x=forecast_index,
-                y=egarch_forecast * np.sqrt(252),
-                mode='lines+markers',
-                name='EGARCH(1,1)',
-                line=dict(color=COLORS['accent_gold'], width=3)
-            ))
-            
-            fig_compare.update_layout(
-                title=f"{selected_asset} - GARCH vs EGARCH Forecast Comparison",
-                xaxis_title="Date",
-                yaxis_title="Annualized Volatility (%)",
-                hovermode='x unified',
-                height=500,
-                template='plotly_white'
-            )
-            st.plotly_chart(fig_compare, use_container_width=True)
-            
-            # Which model is better?
-            st.markdown("**Model Selection Recommendation:**")
-            
-            if garch_results.aic < egarch_results.aic:
-                better_model = "GARCH(1,1)"
-                aic_diff = egarch_results.aic - garch_results.aic
-            else:
-                better_model = "EGARCH(1,1)"
-                aic_diff = garch_results.aic - egarch_results.aic
-            
-            st.success(f"✅ **Recommended Model:** {better_model} (Better AIC by {aic_diff:.2f})")
-            
-            st.info(f"""
-            **Model Selection Insights:**
-            
-            - **GARCH(1,1):** Simpler model, symmetric volatility response
-            - **EGARCH(1,1):** Captures asymmetric effects (leverage effect)
-            
-            **When to use GARCH:** Symmetric markets, simpler forecasting
-            **When to use EGARCH:** Equity markets with leverage effects
-            """)
-            
-        except Exception as e:
-            st.error(f"❌ Error comparing models: {str(e)}")
+@st.fragment
+def render_comparison_tab(returns, symbol, returns_hash, forecast_days, forecast_index, selected_asset, need_comparison):
+    """Tab 4: GARCH vs EGARCH fit statistics and forecasts (isolated fragment)"""
+    # Comparing needs both fits - skip them entirely for a single-model selection
+    if not need_comparison:
+        st.info("ℹ️ **Model comparison needs both models.** Please select 'Both' in the sidebar to compare GARCH(1,1) and EGARCH(1,1).")
+    else:
+        st.markdown("#### 📈 GARCH vs EGARCH Comparison")
+        
+        with st.spinner("⏳ Comparing models..."):
+            try:
+                # Independent MLEs - run any that are missing concurrently, then read both
+                prefetch_model_fits(tuple(MODEL_FITTERS), symbol, returns_hash, returns, forecast_days)
+                garch_results, _, garch_fc_ann = get_model_fit("GARCH(1,1)", symbol, returns_hash, returns, forecast_days)
+                egarch_results, _, egarch_fc_ann = get_model_fit("EGARCH(1,1)", symbol, returns_hash, returns, forecast_days)
+                
+                # Model comparison metrics
+                st.markdown("**Model Performance Metrics:**")
+                
+                comparison_df = pd.DataFrame({
+                    'Metric': ['AIC', 'BIC', 'Log-Likelihood'],
+                    'GARCH(1,1)': [
+                        f"{garch_results.aic:.2f}",
+                        f"{garch_results.bic:.2f}",
+                        f"{garch_results.loglikelihood:.2f}"
+                    ],
+                    'EGARCH(1,1)': [
+                        f"{egarch_results.aic:.2f}",
+                        f"{egarch_results.bic:.2f}",
+                        f"{egarch_results.loglikelihood:.2f}"
+                    ]
+                })
+                st.dataframe(comparison_df, use_container_width=True)
+                
+                # Forecast comparison
+                st.markdown("**Forecast Comparison:**")
+                
+                st.plotly_chart(
+                    build_comparison_figure(
+                        returns_hash, forecast_days, selected_asset,
+                        forecast_index, garch_fc_ann, egarch_fc_ann
+                    ),
+                    use_container_width=True
+                )
+                
+                # Which model is better?
+                st.markdown("**Model Selection Recommendation:**")
+                
+                if garch_results.aic < egarch_results.aic:
+                    better_model = "GARCH(1,1)"
+                    aic_diff = egarch_results.aic - garch_results.aic
+                else:
+                    better_model = "EGARCH(1,1)"
+                    aic_diff = garch_results.aic - egarch_results.aic
+                
+                st.success(f"✅ **Recommended Model:** {better_model} (Better AIC by {aic_diff:.2f})")
+                
+                st.info(f"""
+                **Model Selection Insights:**
+                
+                - **GARCH(1,1):** Simpler model, symmetric volatility response
+                - **EGARCH(1,1):** Captures asymmetric effects (leverage effect)
+                
+                **When to use GARCH:** Symmetric markets, simpler forecasting
+                **When to use EGARCH:** Equity markets with leverage effects
+                """)
+                
+            except Exception as e:
+                st.error(f"❌ Error comparing models: {str(e)}")
+
+if view == VIEWS[3]:
+    render_comparison_tab(returns, symbol, returns_hash, forecast_days, forecast_index, selected_asset, need_comparison)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # TAB 5: DETAILED STATISTICS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-with tab5:
+@st.fragment
+def render_statistics_tab(returns_values, returns_hash, return_stats):
+    """Tab 5: descriptive statistics and autocorrelations (isolated fragment)"""
     st.markdown("#### 📋 Detailed Statistical Analysis")
     
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown("**Returns Statistics:**")
-        stats_df = pd.DataFrame({
+        # Plain column dicts of preformatted strings - no DataFrame built on our side
+        st.table({
             'Metric': ['Mean', 'Std Dev', 'Skewness', 'Kurtosis', 'Min', 'Max'],
             'Value': [
-                f"{returns.mean():.4f}%",
-                f"{returns.std():.4f}%",
-                f"{returns.skew():.4f}",
-                f"{returns.kurtosis():.4f}",
-                f"{returns.min():.4f}%",
-                f"{returns.max():.4f}%"
+                f"{return_stats['mean']:.4f}%",
+                f"{return_stats['std']:.4f}%",
+                f"{return_stats['skew']:.4f}",
+                f"{return_stats['kurt']:.4f}",
+                f"{return_stats['min']:.4f}%",
+                f"{return_stats['max']:.4f}%"
             ]
         })
-        st.dataframe(stats_df, use_container_width=True)
     
     with col2:
         st.markdown("**Volatility Statistics:**")
-        vol_df = pd.DataFrame({
+        st.table({
             'Period': ['20-day', 'Annual'],
             'Volatility': [
-                f"{returns.rolling(20).std().mean():.4f}%",
-                f"{returns.std() * np.sqrt(252):.2f}%"
+                f"{return_stats['rolling_vol_mean']:.4f}%",
+                f"{return_stats['std'] * SQRT_252:.2f}%"
             ]
         })
-        st.dataframe(vol_df, use_container_width=True)
     
-    # ACF plot
+    # ACF plot (FFT autocorrelation, rendered with Plotly)
     st.markdown("**Returns Autocorrelation:**")
-    from statsmodels.graphics.tsaplots import plot_acf
+    
+    acf_returns, acf_squared = compute_return_acfs(returns_hash, returns_values, 40)
     
     col1, col2 = st.columns(2)
     
     with col1:
-        import matplotlib.pyplot as plt
-        fig, ax = plt.subplots(figsize=(10, 4))
-        plot_acf(returns, lags=40, ax=ax, title='ACF of Returns')
-        st.pyplot(fig)
+        st.plotly_chart(
+            build_acf_figure(returns_hash, 'ACF of Returns', len(returns_values), acf_returns),
+            use_container_width=True
+        )
     
     with col2:
-        fig, ax = plt.subplots(figsize=(10, 4))
-        plot_acf(returns**2, lags=40, ax=ax, title='ACF of Squared Returns')
-        st.pyplot(fig)
+        st.plotly_chart(
+            build_acf_figure(returns_hash, 'ACF of Squared Returns', len(returns_values), acf_squared),
+            use_container_width=True
+        )
+
+if view == VIEWS[4]:
+    render_statistics_tab(returns_values, returns_hash, return_stats)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # TAB 6: LEARNING & THEORY
 # ═══════════════════════════════════════════════════════════════════════════════
 
-with tab6:
-    st.markdown("# 📚 Learning & Theory: GARCH & EGARCH Models")
-    
-    # Overview Section
-    st.markdown("---")
-    st.markdown("## 🎯 Overview")
-    st.info("""
-    This section explains the theoretical foundations of GARCH and EGARCH volatility models,
-    including their mathematical basis, assumptions, inputs, and practical interpretations.
-    """)
-    
-    # Create tabs for organized learning
-    learn_tab1, learn_tab2, learn_tab3, learn_tab4, learn_tab5 = st.tabs([
-        "📖 GARCH(1,1)",
-        "⚡ EGARCH(1,1)",
-        "🔬 Comparison",
-        "📊 Forecasting",
-        "💡 Interpretation"
-    ])
-    
-    # ═══════════════════════════════════════════════════════════════════════════════
-    # GARCH EXPLANATION TAB
-    # ═══════════════════════════════════════════════════════════════════════════════
-    with learn_tab1:
-        st.markdown("## GARCH(1,1) Model - Generalized Autoregressive Conditional Heteroskedasticity")
-        
-        st.markdown("### 📐 Mathematical Formula")
-        st.latex(r"""
-        \sigma_t^2 = \omega + \alpha \epsilon_{t-1}^2 + \beta \sigma_{t-1}^2
-        """)
-        
-        st.markdown("### 🔑 Parameter Meanings")
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.markdown("#### ω (Omega)")
-            st.write("""
-            **Constant term**
-            - Long-run average volatility
-            - Baseline volatility level
-            - Must be positive
-            """)
-        
-        with col2:
-            st.markdown("#### α (Alpha)")
-            st.write("""
-            **Shock coefficient**
-            - Measures immediate reaction to shocks
-            - Response to unexpected returns
-            - Range: 0 to 1
-            """)
-        
-        with col3:
-            st.markdown("#### β (Beta)")
-            st.write("""
-            **Persistence coefficient**
-            - Measures volatility persistence
-            - How quickly shocks fade
-            - Range: 0 to 1
-            """)
-        
-        st.markdown("### 💼 Model Inputs")
-        st.markdown("""
-        1. **Historical Returns:** Daily/weekly price changes
-        2. **Time Period:** Historical data for model training (e.g., 3 years)
-        3. **Forecast Horizon:** Future days to forecast volatility
-        """)
-        
-        st.markdown("### 📋 Key Assumptions")
-        st.markdown("""
-        1. **Symmetric Response:** Positive and negative shocks have equal impact
-        2. **Mean Reversion:** Volatility reverts to long-run average
-        3. **Conditional Normality:** Returns follow normal distribution
-        4. **Constant Parameters:** Model coefficients are stable over time
-        5. **Stationarity:** Time series properties don't change over time
-        """)
-        
-        st.markdown("### ✨ Advantages")
-        st.success("""
-        ✅ **Simplicity:** Easy to understand and implement
-        ✅ **Interpretability:** Clear meaning of each parameter
-        ✅ **Effectiveness:** Works well for many financial series
-        ✅ **Computational Efficiency:** Fast to estimate and forecast
-        ✅ **Stability:** Stable estimates for most datasets
-        ✅ **Symmetric:** Good for markets without leverage effects
-        """)
-        
-        st.markdown("### ⚠️ Limitations")
-        st.warning("""
-        ❌ **Symmetric Response:** Ignores leverage effect (negative shocks ≠ positive shocks)
-        ❌ **Parameter Constraints:** Both α and β must be <1 (restrictive)
-        ❌ **Slow Adaptation:** May not capture rapid volatility changes
-        ❌ **Mean Reversion:** Assumes volatility reverts to constant level
-        """)
-        
-        st.markdown("### 🎯 Best Use Cases")
-        st.markdown("""
-        - **Commodities:** Gold, oil, agricultural products
-        - **Symmetric Markets:** Markets without leverage effect
-        - **Stable Periods:** When leverage effect is minimal
-        - **Quick Forecasts:** When speed and simplicity are priorities
-        """)
-    
-    # ═══════════════════════════════════════════════════════════════════════════════
-    # EGARCH EXPLANATION TAB
-    # ═══════════════════════════════════════════════════════════════════════════════
-    with learn_tab2:
-        st.markdown("## EGARCH(1,1) Model - Exponential GARCH")
-        
-        st.markdown("### 📐 Mathematical Formula")
-        st.latex(r"""
-        \log(\sigma_t^2) = \omega + \alpha \frac{\epsilon_{t-1}}{|\sigma_{t-1}|} + \gamma \frac{\epsilon_{t-1}}{\sigma_{t-1}} + \beta \log(\sigma_{t-1}^2)
-        """)
-        
-        st.markdown("### 🔑 Parameter Meanings")
-        
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown("#### ω (Omega)")
-            st.write("""
-            **Intercept**
-            - Baseline log-volatility
-            - Can be negative
-            """)
-        
-        with col2:
-            st.markdown("#### α (Alpha)")
-            st.write("""
-            **Shock magnitude**
-            - Symmetric response component
-            - Size effect
-            """)
-        
-        with col3:
-            st.markdown("#### β (Beta)")
-            st.write("""
-            **Persistence**
-            - Volatility clustering
-            - Memory effect
-            """)
-        
-        with col4:
-            st.markdown("#### γ (Gamma)")
-            st.write("""
-            **Leverage effect**
-            - Asymmetric response
-            - Good news ≠ Bad news
-            """)
-        
-        st.markdown("### 💼 Model Inputs")
-        st.markdown("""
-        1. **Historical Returns:** Daily/weekly price changes
-        2. **Time Period:** Historical data for model training (e.g., 3 years)
-        3. **Forecast Horizon:** Future days to forecast volatility
-        """)
-        
-        st.markdown("### 📋 Key Assumptions")
-        st.markdown("""
-        1. **Asymmetric Response:** Negative shocks have larger impact (leverage effect)
-        2. **Log-Volatility Model:** Uses logarithm of variance (more stable)
-        3. **Mean Reversion:** Volatility reverts to long-run average
-        4. **Conditional Normality:** Returns follow normal distribution
-        5. **Stationarity:** Time series properties don't change over time
-        """)
-        
-        st.markdown("### ✨ Advantages")
-        st.success("""
-        ✅ **Leverage Effect:** Captures asymmetric response to shocks
-        ✅ **Log-Specification:** More stable, no negativity constraints
-        ✅ **Better Fit:** Often provides better fit than GARCH
-        ✅ **Realistic:** Reflects actual market behavior (bad news > good news)
-        ✅ **Flexibility:** No constraint that α+β<1
-        ✅ **Equity Markets:** Particularly good for stocks with leverage effects
-        """)
-        
-        st.markdown("### ⚠️ Limitations")
-        st.warning("""
-        ❌ **Complexity:** More parameters and more difficult to interpret
-        ❌ **Convergence:** Sometimes hard to estimate reliably
-        ❌ **Gamma N/A:** Not all datasets show leverage effects
-        ❌ **Computational Cost:** Slower to estimate and forecast
-        ❌ **Parameter Identification:** Gamma may not be identified in some data
-        """)
-        
-        st.markdown("### 🎯 Best Use Cases")
-        st.markdown("""
-        - **Equity Markets:** Stocks where bad news > good news effect
-        - **High Volatility Assets:** Where leverage effect is pronounced
-        - **Risk Management:** More accurate tail risk estimation
-        - **Option Pricing:** Better for modeling implied volatility
-        """)
-    
-    # ═══════════════════════════════════════════════════════════════════════════════
-    # COMPARISON TAB
-    # ═══════════════════════════════════════════════════════════════════════════════
-    with learn_tab3:
-        st.markdown("## GARCH vs EGARCH: Side-by-Side Comparison")
-        
-        comparison_df = pd.DataFrame({
-            'Feature': [
-                'Response to Shocks',
-                'Leverage Effect',
-                'Parameters',
-                'Complexity',
-                'Estimation Speed',
-                'Positivity Constraint',
-                'Log-Specification',
-                'Best For',
-                'Convergence',
-                'Gamma Parameter'
-            ],
-            'GARCH(1,1)': [
-                'Symmetric',
-                'No',
-                '3 (ω, α, β)',
-                'Simple',
-                'Fast',
-                'Yes (α+β<1)',
-                'No',
-                'Commodities, stable markets',
-                'Easy',
-                'N/A'
-            ],
-            'EGARCH(1,1)': [
-                'Asymmetric',
-                'Yes (γ parameter)',
-                '4 (ω, α, β, γ)',
-                'Complex',
-                'Slower',
-                'No',
-                'Yes',
-                'Equities, risk management',
-                'Sometimes difficult',
-                'Captures asymmetry'
-            ]
-        })
-        
-        st.dataframe(comparison_df, use_container_width=True)
-        
-        st.markdown("### 📊 Model Selection Recommendation")
-        
-        col_g, col_e = st.columns(2)
-        
-        with col_g:
-            st.success("""
-            ### Choose GARCH When:
-            - ✅ Simplicity and speed matter
-            - ✅ No leverage effect visible
-            - ✅ Commodities or symmetric markets
-            - ✅ Quick preliminary analysis needed
-            - ✅ Stable convergence required
-            """)
-        
-        with col_e:
-            st.info("""
-            ### Choose EGARCH When:
-            - ⚡ Leverage effect is present
-            - ⚡ Better fit is more important
-            - ⚡ Equity/stock markets
-            - ⚡ Risk management focus
-            - ⚡ Can tolerate estimation complexity
-            """)
-    
-    # ═══════════════════════════════════════════════════════════════════════════════
-    # FORECASTING TAB
-    # ═══════════════════════════════════════════════════════════════════════════════
-    with learn_tab4:
-        st.markdown("## 🔮 Volatility Forecasting Process")
-        
-        st.markdown("### Step-by-Step Process")
-        
-        steps_data = {
-            'Step': ['1️⃣ Data Preparation', '2️⃣ Model Estimation', '3️⃣ Diagnostic Checks', 
-                     '4️⃣ Forecast Generation', '5️⃣ Interpretation'],
-            'Description': [
-                'Clean historical data, calculate returns',
-                'Estimate ω, α, β (and γ for EGARCH) parameters',
-                'Check model fit (AIC, BIC), residual diagnostics',
-                'Project conditional volatility into future',
-                'Analyze forecasts, assess confidence'
-            ]
-        }
-        
-        st.write(pd.DataFrame(steps_data))
-        
-        st.markdown("### 📈 Forecast Methodology")
-        st.markdown("""
-        **One-Step Ahead Forecasting:**
-        - Use last observed returns and volatility
-        - Generate forecast for next period
-        - Update with new information
-        
-        **Multi-Step Forecasting:**
-        - Use forecasted conditional volatility
-        - Volatility tends toward long-run average
-        - Uncertainty increases with forecast horizon
-        """)
-        
-        st.markdown("### 🎯 Model Fit Statistics")
-        st.markdown("""
-        **AIC (Akaike Information Criterion):**
-        - Lower is better
-        - Penalizes model complexity
-        - Use for model comparison
-        
-        **BIC (Bayesian Information Criterion):**
-        - Lower is better
-        - Stronger penalty for complexity
-        - Preferred for model selection
-        
-        **Log-Likelihood:**
-        - Higher is better
-        - Goodness of fit measure
-        - Basis for information criteria
-        """)
-    
-    # ═══════════════════════════════════════════════════════════════════════════════
-    # INTERPRETATION TAB
-    # ═══════════════════════════════════════════════════════════════════════════════
-    with learn_tab5:
-        st.markdown("## 💡 Interpretation & Practical Use")
-        
-        st.markdown("### Understanding the Parameters")
-        
-        st.markdown("""
-        #### ω (Omega) Interpretation
-        - **Meaning:** Long-run average volatility level
-        - **High ω:** Markets are naturally volatile
-        - **Low ω:** Markets are stable
-        - **Example:** ω=0.05 means 5% baseline daily volatility
-        
-        #### α (Alpha) Interpretation
-        - **High α (0.1-0.3):** Quick response to shocks
-        - **Low α (0.01-0.05):** Slow response to shocks
-        - **Example:** α=0.15 means 15% of yesterday's shock enters today's volatility
-        
-        #### β (Beta) Interpretation
-        - **High β (0.8-0.95):** Volatility is persistent
-        - **Low β (0.3-0.6):** Volatility quickly reverts to mean
-        - **Example:** β=0.85 means 85% of yesterday's volatility stays today
-        
-        #### γ (Gamma) EGARCH Interpretation
-        - **Positive γ:** Negative shocks increase volatility more
-        - **Magnitude of γ:** Strength of leverage effect
-        - **Example:** γ=0.15 means asymmetry is moderate
-        - **Note:** Often N/A for some datasets (means no leverage effect)
-        """)
-        
-        st.markdown("### Reading Forecast Results")
-        
-        st.markdown("""
-        **Volatility Forecast Values:**
-        - **Higher volatility forecast:** Market expects higher uncertainty
-        - **Lower volatility forecast:** Market expects stability
-        - **Increasing trend:** Shocks are accumulating
-        - **Decreasing trend:** Volatility reverting to mean
-        
-        **Using Forecasts:**
-        1. **Risk Management:** Set wider stop-losses for high volatility
-        2. **Options Trading:** Higher volatility → higher option premiums
-        3. **Portfolio Allocation:** Adjust asset weights based on volatility
-        4. **Hedging:** More hedging needed in high volatility periods
-        """)
-        
-        st.markdown("### Practical Guidance")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("#### For Traders")
-            st.markdown("""
-            - **Rising volatility:** Consider reducing position sizes
-            - **Falling volatility:** May signal reversal opportunity
-            - **Forecast accuracy:** Improves near-term (1-5 days)
-            - **Confidence:** Declines for longer horizons
-            """)
-        
-        with col2:
-            st.markdown("#### For Risk Managers")
-            st.markdown("""
-            - **VaR Calculation:** Use model-based volatility
-            - **Margin Requirements:** Adjust based on forecasts
-            - **Stress Testing:** Scenario analysis with high volatility
-            - **Monitoring:** Watch α for shock sensitivity
-            """)
-        
-        st.markdown("### ⚠️ Important Reminders")
-        st.warning("""
-        - **Past volatility ≠ Future volatility:** Use forecasts cautiously
-        - **Model assumptions may not hold:** Test regularly
-        - **Structural breaks:** Models struggle with regime changes
-        - **Tail events:** Models underestimate extreme moves
-        - **Combine with analysis:** Don't rely solely on quantitative models
-        """)
+if view == VIEWS[5]:
+    render_learning_tab()
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # FOOTER
@@ -0,0 +1,32 @@
+"""
+Atomic Write Module
+Temp-file-and-rename writes shared by the on-disk fit and price caches
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable
+
+
+def write_atomic(path: Path, write_fn: Callable[[str], None]) -> None:
+    """
+    Write path through a temp file in the same directory, then rename it into place
+
+    Concurrent readers never see a partial file. If anything fails the temp file is
+    removed (the caches only glob their own suffix, so nothing else would) and the
+    error is re-raised for the caller to report.
+
+    Args:
+        path: final file location (its directory is created if missing)
+        write_fn: callable writing the full contents to the temp path it is given
+    """
+    path.parent.mkdir(exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        write_fn(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
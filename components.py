@@ -14,9 +14,14 @@ Usage:
     SidebarNavigation.render(...)
 """
 
+import functools
 import streamlit as st
+import pandas as pd
 from typing import List, Dict, Optional, Callable
-from styles import get_hero_header_html, get_metric_card_html, get_footer_html
+from styles import (
+    get_hero_header_html, get_metric_card_html, get_single_metric_html, get_card_html,
+    get_footer_html, minify_css
+)
 from config import COLORS, SIDEBAR_CONFIG, SPACING
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -36,6 +41,8 @@ class HeroHeader:
         )
     """
     
+    __slots__ = ()
+    
     @staticmethod
     def render(
         title: str,
@@ -66,6 +73,8 @@ class SidebarNavigation:
         )
     """
     
+    __slots__ = ()
+    
     @staticmethod
     def render(
         title: str,
@@ -80,11 +89,12 @@ class SidebarNavigation:
             Selected option
         """
         with st.sidebar:
-            st.markdown("---")
-            st.write(f"### 📊 {title}")
+            # Static chrome (dividers, title, description) as one markdown element
+            chrome = ["---", f"### 📊 {title}"]
             if description:
-                st.write(description)
-            st.markdown("---")
+                chrome.append(description)
+            chrome.append("---")
+            st.markdown("\n\n".join(chrome))
             
             selected = st.radio(
                 "**Select Option:**",
@@ -97,17 +107,27 @@ class SidebarNavigation:
     
     @staticmethod
     def render_section(title: str, content: str):
-        """Render sidebar section with content"""
+        """Render sidebar section with content (one markdown element)"""
         with st.sidebar:
-            st.markdown("---")
-            st.write(f"**{title}**")
-            st.write(content)
-            st.markdown("---")
+            st.markdown(f"---\n\n**{title}**\n\n{content}\n\n---")
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # METRICS DISPLAY COMPONENT
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@st.cache_data(max_entries=50, show_spinner=False)
+def _build_metrics_html(metrics_key: tuple, columns: int, title: str) -> str:
+    """Section heading plus one CSS grid of metric cards, memoized on the metric values"""
+    # Cards are stripped so no blank line ends the markdown HTML block early
+    cards = "".join(
+        get_metric_card_html(
+            title=card_title, value=value, description=description, emoji=emoji, highlight=highlight
+        ).strip()
+        for card_title, value, description, emoji, highlight in metrics_key
+    )
+    grid = f'<div style="display: grid; grid-template-columns: repeat({columns}, 1fr); gap: 1rem;">{cards}</div>'
+    return f"### 🎯 {title}\n\n{grid}" if title else grid
+
 class MetricsDisplay:
     """
     Display metrics in a grid layout with professional styling
@@ -120,6 +140,8 @@ class MetricsDisplay:
         ])
     """
     
+    __slots__ = ()
+    
     @staticmethod
     def render_metrics(
         metrics: List[Dict],
@@ -127,52 +149,30 @@ class MetricsDisplay:
         title: str = "METRICS"
     ):
         """
-        Render metrics in a grid
+        Render metrics in a grid (one markdown element, HTML cached per metric values)
         
         Args:
             metrics: List of dicts with keys: title, value, emoji, description, highlight
             columns: Number of columns
             title: Section title
         """
-        if title:
-            st.markdown(f"### 🎯 {title}")
-        
-        cols = st.columns(columns)
-        
-        for idx, metric in enumerate(metrics):
-            with cols[idx % columns]:
-                st.markdown(
-                    get_metric_card_html(
-                        title=metric.get("title", ""),
-                        value=metric.get("value", ""),
-                        description=metric.get("description", ""),
-                        emoji=metric.get("emoji", "📊"),
-                        highlight=metric.get("highlight", False)
-                    ),
-                    unsafe_allow_html=True
-                )
+        # Dicts aren't hashable - key the HTML cache on one tuple per metric
+        metrics_key = tuple(
+            (
+                metric.get("title", ""),
+                metric.get("value", ""),
+                metric.get("description", ""),
+                metric.get("emoji", "📊"),
+                metric.get("highlight", False)
+            )
+            for metric in metrics
+        )
+        st.markdown(_build_metrics_html(metrics_key, columns, title), unsafe_allow_html=True)
     
     @staticmethod
     def render_single_metric(title: str, value: str, description: str = ""):
-        """Render a single metric"""
-        col1, col2, col3 = st.columns([1, 2, 1])
-        with col2:
-            st.markdown(
-                f"""
-                <div style="
-                    background: linear-gradient(135deg, #003d70 0%, #005a9d 100%);
-                    padding: 2rem;
-                    border-radius: 15px;
-                    text-align: center;
-                    color: white;
-                ">
-                    <h3 style="color: white; margin: 0;">{title}</h3>
-                    <h1 style="color: {COLORS['accent_gold']}; margin: 0.5rem 0;">{value}</h1>
-                    <p style="color: white; margin: 0; font-size: 12px;">{description}</p>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
+        """Render a single metric, centered at half width (plain CSS, no column sandwich)"""
+        st.markdown(get_single_metric_html(title, value, description), unsafe_allow_html=True)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # TABS COMPONENT
@@ -190,27 +190,36 @@ class TabsDisplay:
         })
     """
     
+    __slots__ = ()
+    
     @staticmethod
     def render(
         tabs: Dict[str, Callable],
-        title: str = ""
+        title: str = "",
+        key: Optional[str] = None
     ):
         """
-        Render tabs
+        Render tabs - only the selected tab's function runs
+        
+        st.tabs would execute every tab body on each rerun, so the tab strip is a
+        horizontal radio and just the active callback is invoked.
         
         Args:
             tabs: Dict with tab_name: render_function
             title: Section title
+            key: Widget key (needed when several TabsDisplay are on one page)
         """
         if title:
             st.markdown(f"### {title}")
         
-        tab_list = list(tabs.keys())
-        tab_objects = st.tabs(tab_list)
-        
-        for tab_obj, tab_name in zip(tab_objects, tab_list):
-            with tab_obj:
-                tabs[tab_name]()
+        active_tab = st.radio(
+            title or "Tabs",
+            options=list(tabs),
+            horizontal=True,
+            label_visibility="collapsed",
+            key=key
+        )
+        tabs[active_tab]()
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CARD COMPONENT
@@ -228,6 +237,8 @@ class CardDisplay:
         )
     """
     
+    __slots__ = ()
+    
     @staticmethod
     def render_card(
         title: str,
@@ -236,31 +247,7 @@ class CardDisplay:
         highlight: bool = False
     ):
         """Render a single card"""
-        if highlight:
-            st.markdown(f"""
-            <div style="
-                background: linear-gradient(135deg, #003d70 0%, #005a9d 100%);
-                border: 2px solid {COLORS['accent_gold']};
-                padding: 1.5rem;
-                border-radius: 15px;
-                color: white;
-            ">
-                <h3 style="color: white; margin-top: 0;">{icon} {title}</h3>
-                <p style="color: white;">{content}</p>
-            </div>
-            """, unsafe_allow_html=True)
-        else:
-            st.markdown(f"""
-            <div style="
-                background: linear-gradient(135deg, #003d70 0%, #005a9d 100%);
-                padding: 1.5rem;
-                border-radius: 15px;
-                color: white;
-            ">
-                <h3 style="color: white; margin-top: 0;">{icon} {title}</h3>
-                <p style="color: white;">{content}</p>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(get_card_html(title, content, icon, highlight), unsafe_allow_html=True)
     
     @staticmethod
     def render_cards_grid(
@@ -269,26 +256,24 @@ class CardDisplay:
         title: str = ""
     ):
         """
-        Render multiple cards in a grid
+        Render multiple cards in a CSS grid (one markdown element)
         
         Args:
             cards: List of dicts with title, content, icon
             columns: Number of columns
             title: Section title
         """
-        if title:
-            st.markdown(f"### {title}")
-        
-        cols = st.columns(columns)
-        
-        for idx, card in enumerate(cards):
-            with cols[idx % columns]:
-                CardDisplay.render_card(
-                    title=card.get("title", ""),
-                    content=card.get("content", ""),
-                    icon=card.get("icon", "📊"),
-                    highlight=card.get("highlight", False)
-                )
+        cards_html = "".join(
+            get_card_html(
+                title=card.get("title", ""),
+                content=card.get("content", ""),
+                icon=card.get("icon", "📊"),
+                highlight=card.get("highlight", False)
+            )
+            for card in cards
+        )
+        grid = f'<div style="display: grid; grid-template-columns: repeat({columns}, 1fr); gap: 1rem;">{cards_html}</div>'
+        st.markdown(f"### {title}\n\n{grid}" if title else grid, unsafe_allow_html=True)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # STATS COMPONENT
@@ -305,6 +290,8 @@ class StatsDisplay:
         ])
     """
     
+    __slots__ = ()
+    
     @staticmethod
     def render(stats: List[Dict], columns: int = 4):
         """Render statistics"""
@@ -323,12 +310,207 @@ class StatsDisplay:
 # FOOTER COMPONENT
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Footer stylesheet - minified once at import rather than per render
+_FOOTER_CSS = minify_css("""
+<style>
+.footer-simple {
+    text-align: center !important;
+    padding: 0.3rem 1rem !important;
+    margin-top: 0.5rem !important;
+    width: 100% !important;
+    max-width: 100% !important;
+    display: flex !important;
+    flex-direction: column !important;
+    align-items: center !important;
+    justify-content: center !important;
+    gap: 0.2rem !important;
+}
+
+.footer-title {
+    color: #003366 !important;
+    font-size: 18px !important;
+    font-weight: 700 !important;
+    margin: 0 auto !important;
+    padding: 0 !important;
+    letter-spacing: 0.5px !important;
+    text-align: center !important;
+    width: 100% !important;
+    display: block !important;
+    line-height: 1.2 !important;
+}
+
+.footer-subtitle {
+    color: #0077b5 !important;
+    font-size: 12px !important;
+    font-weight: 500 !important;
+    margin: 0 auto !important;
+    padding: 0 !important;
+    text-align: center !important;
+    width: 100% !important;
+    display: block !important;
+    line-height: 1.2 !important;
+}
+
+.footer-author {
+    color: #666 !important;
+    font-size: 11px !important;
+    margin: 0 auto !important;
+    padding: 0 !important;
+    text-align: center !important;
+    width: 100% !important;
+    display: block !important;
+    line-height: 1.2 !important;
+}
+
+.footer-buttons {
+    display: flex !important;
+    flex-direction: row !important;
+    align-items: center !important;
+    justify-content: center !important;
+    gap: 0.8rem !important;
+    margin: 0.3rem auto 0.3rem auto !important;
+    width: 100% !important;
+    flex-wrap: nowrap !important;
+    padding: 0 !important;
+}
+
+.footer-btn {
+    display: inline-flex !important;
+    align-items: center !important;
+    justify-content: center !important;
+    padding: 0.5rem 1.2rem !important;
+    border-radius: 5px !important;
+    color: white !important;
+    text-decoration: none !important;
+    font-weight: 600 !important;
+    font-size: 13px !important;
+    transition: all 0.2s !important;
+    border: none !important;
+    cursor: pointer !important;
+    white-space: nowrap !important;
+    flex-shrink: 0 !important;
+    margin: 0 !important;
+}
+
+.footer-btn:hover {
+    transform: translateY(-2px) !important;
+    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.15) !important;
+}
+
+.btn-linkedin {
+    background: #0077b5 !important;
+}
+
+.btn-linkedin:hover {
+    background: #005a87 !important;
+    color: white !important;
+}
+
+.btn-github {
+    background: #2d2d2d !important;
+}
+
+.btn-github:hover {
+    background: #1a1a1a !important;
+    color: white !important;
+}
+
+.footer-disclaimer {
+    color: #333 !important;
+    font-size: 11px !important;
+    margin: 0.3rem auto !important;
+    padding: 0 !important;
+    line-height: 1.3 !important;
+    text-align: center !important;
+    width: 100% !important;
+}
+
+.footer-divider {
+    height: 1px !important;
+    background: #e0e0e0 !important;
+    margin: 0.3rem auto !important;
+    width: 100% !important;
+}
+
+.footer-copyright {
+    color: #999 !important;
+    font-size: 11px !important;
+    margin: 0.2rem auto !important;
+    padding: 0 !important;
+    text-align: center !important;
+    line-height: 1.2 !important;
+}
+
+.footer-credit {
+    color: #aaa !important;
+    font-size: 11px !important;
+    margin: 0.2rem auto !important;
+    padding: 0 !important;
+    font-style: italic !important;
+    text-align: center !important;
+    line-height: 1.2 !important;
+}
+</style>
+""")
+
+# Social link name -> (emoji, button classes); anything else renders as a mail-style button
+_SOCIAL_META = {
+    "LinkedIn": ("🔗", "footer-btn btn-linkedin"),
+    "GitHub": ("🐙", "footer-btn btn-github"),
+}
+_SOCIAL_META_DEFAULT = ("📧", "footer-btn btn-linkedin")
+
+# Fixed footer lines - plain literals, no per-render formatting
+_FOOTER_DIVIDER_HTML = '<div class="footer-divider"></div>'
+_FOOTER_COPYRIGHT_HTML = '<p class="footer-copyright">© 2025 The Mountain Path - World of Finance | All Rights Reserved</p>'
+_FOOTER_BUILT_WITH_HTML = '<p class="footer-credit">Built with ❤️ using Streamlit, GARCH & EGARCH Models</p>'
+
+
+@functools.lru_cache(maxsize=32)
+def _footer_html(title: str, description: str, author: str, social_links: tuple, disclaimer: str) -> str:
+    """Complete footer payload (stylesheet + markup), memoized per footer content"""
+    # Title section - CENTERED
+    html_parts = [
+        '<div class="footer-simple">',
+        f'<p class="footer-title">{title}</p>',
+        f'<p class="footer-subtitle">{description}</p>',
+        f'<p class="footer-author">{author}</p>',
+    ]
+    
+    # Buttons - one flex row
+    if social_links:
+        html_parts.append('<div class="footer-buttons">')
+        
+        for name, url in social_links:
+            emoji, btn_class = _SOCIAL_META.get(name, _SOCIAL_META_DEFAULT)
+            html_parts.append(f'<a href="{url}" target="_blank" class="{btn_class}">{emoji} {name}</a>')
+        
+        html_parts.append('</div>')
+    
+    # Divider
+    html_parts.append(_FOOTER_DIVIDER_HTML)
+    
+    # Disclaimer - CENTERED TEXT ONLY (NO BOX!)
+    if disclaimer:
+        html_parts.append(f'<p class="footer-disclaimer">⚠️ <strong>DISCLAIMER:</strong> {disclaimer}</p>')
+    
+    # Divider
+    html_parts.append(_FOOTER_DIVIDER_HTML)
+    
+    # Copyright - CENTERED
+    html_parts.extend((_FOOTER_COPYRIGHT_HTML, _FOOTER_BUILT_WITH_HTML, '</div>'))
+    
+    # Kept on one line: a blank line would end the markdown HTML block early
+    return _FOOTER_CSS + "".join(html_parts)
+
 class Footer:
     """
     Simple, clean, professional footer component
     Centered layout, minimal design
     """
     
+    __slots__ = ()
+    
     @staticmethod
     def render(
         title: str,
@@ -339,198 +521,19 @@ class Footer:
     ):
         """Render simple, clean, centered footer"""
         
-        # Simple CSS - centered layout, MINIMAL SPACING
-        st.markdown("""
-        <style>
-        .footer-simple {
-            text-align: center !important;
-            padding: 0.3rem 1rem !important;
-            margin-top: 0.5rem !important;
-            width: 100% !important;
-            max-width: 100% !important;
-            display: flex !important;
-            flex-direction: column !important;
-            align-items: center !important;
-            justify-content: center !important;
-            gap: 0.2rem !important;
-        }
-        
-        .footer-title {
-            color: #003366 !important;
-            font-size: 18px !important;
-            font-weight: 700 !important;
-            margin: 0 auto !important;
-            padding: 0 !important;
-            letter-spacing: 0.5px !important;
-            text-align: center !important;
-            width: 100% !important;
-            display: block !important;
-            line-height: 1.2 !important;
-        }
-        
-        .footer-subtitle {
-            color: #0077b5 !important;
-            font-size: 12px !important;
-            font-weight: 500 !important;
-            margin: 0 auto !important;
-            padding: 0 !important;
-            text-align: center !important;
-            width: 100% !important;
-            display: block !important;
-            line-height: 1.2 !important;
-        }
-        
-        .footer-author {
-            color: #666 !important;
-            font-size: 11px !important;
-            margin: 0 auto !important;
-            padding: 0 !important;
-            text-align: center !important;
-            width: 100% !important;
-            display: block !important;
-            line-height: 1.2 !important;
-        }
-        
-        .footer-buttons {
-            display: flex !important;
-            flex-direction: row !important;
-            align-items: center !important;
-            justify-content: center !important;
-            gap: 0.8rem !important;
-            margin: 0.3rem auto 0.3rem auto !important;
-            width: 100% !important;
-            flex-wrap: nowrap !important;
-            padding: 0 !important;
-        }
-        
-        .footer-btn {
-            display: inline-flex !important;
-            align-items: center !important;
-            justify-content: center !important;
-            padding: 0.5rem 1.2rem !important;
-            border-radius: 5px !important;
-            color: white !important;
-            text-decoration: none !important;
-            font-weight: 600 !important;
-            font-size: 13px !important;
-            transition: all 0.2s !important;
-            border: none !important;
-            cursor: pointer !important;
-            white-space: nowrap !important;
-            flex-shrink: 0 !important;
-            margin: 0 !important;
-        }
-        
-        .footer-btn:hover {
-            transform: translateY(-2px) !important;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.15) !important;
-        }
-        
-        .btn-linkedin {
-            background: #0077b5 !important;
-        }
-        
-        .btn-linkedin:hover {
-            background: #005a87 !important;
-            color: white !important;
-        }
-        
-        .btn-github {
-            background: #2d2d2d !important;
-        }
-        
-        .btn-github:hover {
-            background: #1a1a1a !important;
-            color: white !important;
-        }
-        
-        .footer-disclaimer {
-            color: #333 !important;
-            font-size: 11px !important;
-            margin: 0.3rem auto !important;
-            padding: 0 !important;
-            line-height: 1.3 !important;
-            text-align: center !important;
-            width: 100% !important;
-        }
-        
-        .footer-divider {
-            height: 1px !important;
-            background: #e0e0e0 !important;
-            margin: 0.3rem auto !important;
-            width: 100% !important;
-        }
-        
-        .footer-copyright {
-            color: #999 !important;
-            font-size: 11px !important;
-            margin: 0.2rem auto !important;
-            padding: 0 !important;
-            text-align: center !important;
-            line-height: 1.2 !important;
-        }
-        
-        .footer-credit {
-            color: #aaa !important;
-            font-size: 11px !important;
-            margin: 0.2rem auto !important;
-            padding: 0 !important;
-            font-style: italic !important;
-            text-align: center !important;
-            line-height: 1.2 !important;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-        
-        # Render - all centered
-        st.markdown('<div class="footer-simple">', unsafe_allow_html=True)
-        
-        # Title section - CENTERED
-        st.markdown(f'<p class="footer-title">{title}</p>', unsafe_allow_html=True)
-        st.markdown(f'<p class="footer-subtitle">{description}</p>', unsafe_allow_html=True)
-        st.markdown(f'<p class="footer-author">{author}</p>', unsafe_allow_html=True)
-        
-        # Buttons - ALL IN ONE MARKDOWN CALL TO KEEP FLEX LAYOUT INTACT
-        if social_links:
-            buttons_html = '<div class="footer-buttons">'
-            
-            for name, url in social_links.items():
-                if name == "LinkedIn":
-                    emoji = "🔗"
-                    btn_class = "footer-btn btn-linkedin"
-                elif name == "GitHub":
-                    emoji = "🐙"
-                    btn_class = "footer-btn btn-github"
-                else:
-                    emoji = "📧"
-                    btn_class = "footer-btn btn-linkedin"
-                
-                buttons_html += f'<a href="{url}" target="_blank" class="{btn_class}">{emoji} {name}</a>'
-            
-            buttons_html += '</div>'
-            
-            # RENDER ALL BUTTONS IN ONE CALL - PRESERVES FLEXBOX
-            st.markdown(buttons_html, unsafe_allow_html=True)
-        
-        # Divider
-        st.markdown('<div class="footer-divider"></div>', unsafe_allow_html=True)
-        
-        # Disclaimer - CENTERED TEXT ONLY (NO BOX!)
-        if disclaimer:
-            st.markdown(
-                f'<p class="footer-disclaimer">⚠️ <strong>DISCLAIMER:</strong> {disclaimer}</p>',
-                unsafe_allow_html=True
-            )
-        
-        # Divider
-        st.markdown('<div class="footer-divider"></div>', unsafe_allow_html=True)
-        
-        # Copyright - CENTERED
-        st.markdown('<p class="footer-copyright">© 2025 The Mountain Path - World of Finance | All Rights Reserved</p>', unsafe_allow_html=True)
-        st.markdown('<p class="footer-credit">Built with ❤️ using Streamlit, GARCH & EGARCH Models</p>', unsafe_allow_html=True)
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+        # Stylesheet and markup go out as ONE markdown element, re-emitted every run
+        # (Streamlit drops elements a rerun doesn't redraw); dicts aren't hashable,
+        # so the cached builder gets the social links as (name, url) pairs
+        st.markdown(
+            _footer_html(title, description, author, tuple((social_links or {}).items()), disclaimer),
+            unsafe_allow_html=True
+        )
+
 
+@functools.lru_cache(maxsize=128)
+def _expander_label(icon: str, title: str) -> str:
+    """Expander label, memoized per (icon, title)"""
+    return f"{icon} {title}"
 
 class ExpanderSection:
     """
@@ -541,10 +544,12 @@ class ExpanderSection:
             st.write("Content here")
     """
     
+    __slots__ = ()
+    
     @staticmethod
     def render(title: str, icon: str = "📌"):
         """Render expander section"""
-        return st.expander(f"{icon} {title}")
+        return st.expander(_expander_label(icon, title))
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # DATA TABLE COMPONENT
@@ -558,6 +563,8 @@ class DataDisplay:
         DataDisplay.render_table(dataframe, title="Data Table")
     """
     
+    __slots__ = ()
+    
     @staticmethod
     def render_table(data, title: str = "", use_container_width: bool = True):
         """Render data table"""
@@ -576,7 +583,6 @@ class DataDisplay:
         if title:
             st.markdown(f"### 📊 {title}")
         
-        import pandas as pd
         df = pd.DataFrame(data)
         st.dataframe(df, use_container_width=True)
 
@@ -11,8 +11,11 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Tuple
+import logging
 import time
 
+logger = logging.getLogger(__name__)
+
 class DataFetcher:
     """Fetch and process financial data from Yahoo Finance"""
     
@@ -60,7 +63,8 @@ class DataFetcher:
         symbol: str,
         period: str = "3y",
         interval: str = "1d",
-        retries: int = 3
+        retries: int = 3,
+        session=None
     ) -> Optional[pd.DataFrame]:
         """
         Fetch stock/index/commodity data from Yahoo Finance
@@ -70,6 +74,8 @@ class DataFetcher:
             period: Time period (e.g., "1y", "3y", "10y")
             interval: Data interval (default: "1d" for daily)
             retries: Number of retry attempts
+            session: Optional HTTP session shared across fetches (keeps
+                     connections alive); yfinance creates its own if None
         
         Returns:
             DataFrame with OHLCV data or None if error
@@ -78,14 +84,14 @@ class DataFetcher:
         
         for attempt in range(retries):
             try:
-                print(f"📊 Fetching data for {symbol} (Attempt {attempt + 1}/{retries})...")
+                logger.debug("Fetching data for %s (attempt %d/%d)", symbol, attempt + 1, retries)
                 
-                ticker = yf.Ticker(symbol)
+                ticker = yf.Ticker(symbol, session=session)
                 data = ticker.history(period=period, interval=interval)
                 
                 if data is None or len(data) == 0:
                     last_error = f"No data retrieved for {symbol}"
-                    print(f"⚠️ {last_error}, retrying...")
+                    logger.warning("%s, retrying...", last_error)
                     time.sleep(1)
                     continue
                 
@@ -94,21 +100,21 @@ class DataFetcher:
                 
                 if len(data) < 50:
                     last_error = f"Only {len(data)} trading days available (< 50 minimum)"
-                    print(f"⚠️ {last_error}, retrying...")
+                    logger.warning("%s, retrying...", last_error)
                     time.sleep(1)
                     continue
                 
-                print(f"✅ Successfully fetched {len(data)} trading days for {symbol}")
+                logger.info("Fetched %d trading days for %s", len(data), symbol)
                 return data
             
             except Exception as e:
                 last_error = str(e)
-                print(f"❌ Attempt {attempt + 1} failed: {last_error}")
+                logger.warning("Attempt %d failed: %s", attempt + 1, last_error)
                 if attempt < retries - 1:
                     time.sleep(1)  # Wait before retry
                 continue
         
-        print(f"❌ Failed to fetch {symbol} after {retries} attempts: {last_error}")
+        logger.error("Failed to fetch %s after %d attempts: %s", symbol, retries, last_error)
         return None
     
     @staticmethod
@@ -146,14 +152,20 @@ class DataFetcher:
             method: "log" (default) or "simple"
         
         Returns:
-            Series of returns (in percentage)
+            Series of returns (in percentage), indexed from the second price
         """
+        # Single numpy pass over the raw values - no shift/align/dropna temporaries.
+        # Prices are expected NaN-free, as returned by fetch_stock_data.
+        values = prices.to_numpy(dtype=np.float64)
+        returns = np.divide(values[1:], values[:-1])  # the only allocation
+        
         if method == "log":
-            returns = np.log(prices / prices.shift(1)).dropna()
+            np.log(returns, out=returns)
         else:
-            returns = ((prices / prices.shift(1)) - 1).dropna()
+            np.subtract(returns, 1.0, out=returns)
         
-        return returns * 100  # Convert to percentage
+        returns *= 100.0  # Convert to percentage
+        return pd.Series(returns, index=prices.index[1:], name=prices.name, copy=False)
     
     @staticmethod
     def calculate_rolling_volatility(
@@ -199,7 +211,7 @@ class DataFetcher:
                 "52WeekLow": info.get("fiftyTwoWeekLow", "N/A"),
             }
         except Exception as e:
-            print(f"Warning: Could not fetch info for {symbol}: {e}")
+            logger.warning("Could not fetch info for %s: %s", symbol, e)
             return {}
     
     @staticmethod
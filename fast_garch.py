@@ -0,0 +1,194 @@
+"""
+Fast GARCH Module
+Numba-compiled likelihoods that locate the MLE before arch polishes it
+"""
+
+import math
+import numpy as np
+from scipy.optimize import minimize
+
+from numeric_kernels import NUMBA_AVAILABLE, njit
+
+LOG_2PI = math.log(2.0 * math.pi)
+ABS_NORMAL_MEAN = math.sqrt(2.0 / math.pi)  # E|z| for standard normal z
+
+
+def variance_backcast(resids: np.ndarray) -> float:
+    """arch's default backcast: exponentially weighted (0.94) mean of the first 75 squared residuals"""
+    tau = min(75, resids.size)
+    weights = 0.94 ** np.arange(tau)
+    weights /= weights.sum()
+    return float(np.sum(resids[:tau] ** 2 * weights))
+
+
+@njit(fastmath=True, cache=True)
+def garch11_loglik(params, r, backcast):
+    """
+    Negative Gaussian log-likelihood of a constant-mean GARCH(1,1) and its gradient
+
+    params = [mu, omega, alpha, beta] (arch's order). The variance recursion is
+    seeded with the backcast exactly as arch does, and the derivatives of sigma2
+    are carried alongside it, so one pass yields (nll, grad).
+    """
+    mu = params[0]
+    omega = params[1]
+    alpha = params[2]
+    beta = params[3]
+
+    # sigma2_0 = omega + (alpha + beta) * backcast
+    s = omega + (alpha + beta) * backcast
+    ds_mu = 0.0
+    ds_omega = 1.0
+    ds_alpha = backcast
+    ds_beta = backcast
+
+    nll = 0.0
+    grad = np.zeros(4)
+
+    for t in range(r.size):
+        if t > 0:
+            e_prev = r[t - 1] - mu
+            ds_mu = -2.0 * alpha * e_prev + beta * ds_mu
+            ds_omega = 1.0 + beta * ds_omega
+            ds_alpha = e_prev * e_prev + beta * ds_alpha
+            ds_beta = s + beta * ds_beta  # s is still sigma2_{t-1} here
+            s = omega + alpha * e_prev * e_prev + beta * s
+
+        e = r[t] - mu
+        e2_s = e * e / s
+        nll += 0.5 * (LOG_2PI + math.log(s) + e2_s)
+
+        dl_ds = 0.5 * (1.0 - e2_s) / s
+        grad[0] += dl_ds * ds_mu - e / s
+        grad[1] += dl_ds * ds_omega
+        grad[2] += dl_ds * ds_alpha
+        grad[3] += dl_ds * ds_beta
+
+    return nll, grad
+
+
+def fit_garch11_fast(returns, starting_values):
+    """
+    MLE of a constant-mean GARCH(1,1) on the compiled likelihood
+
+    Args:
+        returns: NaN-free returns (same scale arch is fitted on)
+        starting_values: [mu, omega, alpha, beta] to start the optimizer from
+
+    Returns:
+        Estimated [mu, omega, alpha, beta], or None if Numba is unavailable or the
+        optimizer did not converge (the caller then lets arch start on its own)
+    """
+    if not NUMBA_AVAILABLE:  # the interpreted loop would be slower than arch itself
+        return None
+
+    # Writable copy: the specialization warmed at startup (pandas >= 3 hands out read-only arrays)
+    r = np.array(returns, dtype=np.float64)
+    resids = r - r.mean()
+    backcast = variance_backcast(resids)
+    variance = max(float(np.mean(resids ** 2)), 1e-8)
+
+    result = minimize(
+        garch11_loglik,
+        np.asarray(starting_values, dtype=np.float64),
+        args=(r, backcast),
+        jac=True,
+        method='SLSQP',
+        # Same box as arch, plus stationarity alpha + beta <= 1
+        bounds=[(None, None), (1e-8 * variance, 10.0 * variance), (0.0, 1.0), (0.0, 1.0)],
+        constraints={
+            'type': 'ineq',
+            'fun': lambda p: 1.0 - p[2] - p[3],
+            'jac': lambda p: np.array([0.0, 0.0, -1.0, -1.0]),
+        },
+        options={'maxiter': 200},
+    )
+    if not result.success or not np.isfinite(result.fun):
+        return None
+    return result.x
+
+
+@njit(fastmath=True, cache=True)
+def egarch11_loglik(params, r, backcast):
+    """
+    Negative Gaussian log-likelihood of a constant-mean EGARCH(1,1) and its gradient
+
+    params = [mu, omega, alpha, beta] (arch's order, no asymmetry term as in the
+    app's arch_model(vol='EGarch', p=1, q=1)). backcast is the log-variance seed;
+    the standardized residual z_{t-1} is carried as a scalar between steps.
+    """
+    mu = params[0]
+    omega = params[1]
+    alpha = params[2]
+    beta = params[3]
+
+    # ln sigma2_0 = omega + beta * backcast (arch adds no news term at t = 0)
+    h = omega + beta * backcast
+    dh_mu = 0.0
+    dh_omega = 1.0
+    dh_alpha = 0.0
+    dh_beta = backcast
+
+    nll = 0.0
+    grad = np.zeros(4)
+
+    for t in range(r.size):
+        if t > 0:
+            inv_sigma = math.exp(-0.5 * h)
+            z = (r[t - 1] - mu) * inv_sigma
+            news_slope = alpha if z >= 0.0 else -alpha  # d(alpha * |z|) / dz
+            # dz/dtheta = -z/2 * dh/dtheta (plus -1/sigma for mu); old derivatives used on the right
+            dh_mu = news_slope * (-inv_sigma - 0.5 * z * dh_mu) + beta * dh_mu
+            dh_omega = 1.0 - news_slope * 0.5 * z * dh_omega + beta * dh_omega
+            dh_alpha = abs(z) - ABS_NORMAL_MEAN - news_slope * 0.5 * z * dh_alpha + beta * dh_alpha
+            dh_beta = h - news_slope * 0.5 * z * dh_beta + beta * dh_beta
+            h = omega + alpha * (abs(z) - ABS_NORMAL_MEAN) + beta * h
+
+        e = r[t] - mu
+        inv_var = math.exp(-h)
+        e2_s = e * e * inv_var
+        nll += 0.5 * (LOG_2PI + h + e2_s)
+
+        dl_dh = 0.5 * (1.0 - e2_s)
+        grad[0] += dl_dh * dh_mu - e * inv_var
+        grad[1] += dl_dh * dh_omega
+        grad[2] += dl_dh * dh_alpha
+        grad[3] += dl_dh * dh_beta
+
+    return nll, grad
+
+
+def fit_egarch11_fast(returns, starting_values):
+    """
+    MLE of a constant-mean EGARCH(1,1) on the compiled likelihood
+
+    Args:
+        returns: NaN-free returns (same scale arch is fitted on)
+        starting_values: [mu, omega, alpha, beta] to start the optimizer from
+
+    Returns:
+        Estimated [mu, omega, alpha, beta], or None if Numba is unavailable or the
+        optimizer did not converge (the caller then lets arch start on its own)
+    """
+    if not NUMBA_AVAILABLE:
+        return None
+
+    r = np.array(returns, dtype=np.float64)  # writable copy, as above
+    resids = r - r.mean()
+    backcast = math.log(variance_backcast(resids))
+    log_variance = math.log(max(float(np.mean(resids ** 2)), 1e-8))
+
+    result = minimize(
+        egarch11_loglik,
+        np.asarray(starting_values, dtype=np.float64),
+        args=(r, backcast),
+        jac=True,
+        method='SLSQP',
+        # Same box as arch: omega within 4 decades of the log sample variance, 0 <= beta <= 1
+        bounds=[(None, None), (log_variance - math.log(1e4), log_variance + math.log(1e4)),
+                (None, None), (0.0, 1.0)],
+        options={'maxiter': 200},
+    )
+    if not result.success or not np.isfinite(result.fun):
+        return None
+    return result.x
@@ -0,0 +1,63 @@
+"""
+Fit Cache Module
+Content-addressed on-disk cache for fitted models, so a cold restart skips the MLE
+"""
+
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Callable
+
+from atomic_write import write_atomic
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(__file__).resolve().parent / ".fitcache"
+MAX_FILES = 100
+
+
+def load_or_fit(key: str, fit_fn: Callable[[], Any]) -> Any:
+    """
+    Return the pickled result stored under key, or run fit_fn and store its result
+
+    Args:
+        key: content hash of the inputs (e.g. returns digest + horizon + model)
+        fit_fn: zero-argument callable producing the result on a miss
+
+    Returns:
+        The cached or freshly computed result. Disk errors never fail the fit -
+        an unreadable entry is refitted and an unwritable cache is skipped.
+    """
+    path = CACHE_DIR / f"{key}.pkl"
+
+    try:
+        with path.open("rb") as f:
+            result = pickle.load(f)
+        os.utime(path)  # mark as recently used for LRU eviction
+        return result
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning("Discarding unreadable fit cache entry %s: %s", path.name, e)
+
+    result = fit_fn()
+
+    def dump(tmp_path: str) -> None:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    try:
+        write_atomic(path, dump)
+        _evict(MAX_FILES)
+    except Exception as e:
+        logger.warning("Could not persist fit cache entry %s: %s", path.name, e)
+
+    return result
+
+
+def _evict(max_files: int) -> None:
+    """Delete the least recently used entries beyond max_files"""
+    entries = sorted(CACHE_DIR.glob("*.pkl"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for stale in entries[max_files:]:
+        stale.unlink(missing_ok=True)
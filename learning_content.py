@@ -0,0 +1,403 @@
+"""
+Learning Content Module
+Static Learning & Theory tab content, kept as data and rendered by a small dispatcher
+
+Everything here is built once, when the module is first imported - unlike app.py,
+which Streamlit re-executes from the top on every rerun.
+"""
+
+import pandas as pd
+import streamlit as st
+
+MODEL_FEATURES_DF = pd.DataFrame({
+    'Feature': [
+        'Response to Shocks',
+        'Leverage Effect',
+        'Parameters',
+        'Complexity',
+        'Estimation Speed',
+        'Positivity Constraint',
+        'Log-Specification',
+        'Best For',
+        'Convergence',
+        'Gamma Parameter'
+    ],
+    'GARCH(1,1)': [
+        'Symmetric',
+        'No',
+        '3 (ω, α, β)',
+        'Simple',
+        'Fast',
+        'Yes (α+β<1)',
+        'No',
+        'Commodities, stable markets',
+        'Easy',
+        'N/A'
+    ],
+    'EGARCH(1,1)': [
+        'Asymmetric',
+        'Yes (γ parameter)',
+        '4 (ω, α, β, γ)',
+        'Complex',
+        'Slower',
+        'No',
+        'Yes',
+        'Equities, risk management',
+        'Sometimes difficult',
+        'Captures asymmetry'
+    ]
+})
+
+FORECAST_STEPS_DF = pd.DataFrame({
+    'Step': ['1️⃣ Data Preparation', '2️⃣ Model Estimation', '3️⃣ Diagnostic Checks', 
+             '4️⃣ Forecast Generation', '5️⃣ Interpretation'],
+    'Description': [
+        'Clean historical data, calculate returns',
+        'Estimate ω, α, β (and γ for EGARCH) parameters',
+        'Check model fit (AIC, BIC), residual diagnostics',
+        'Project conditional volatility into future',
+        'Analyze forecasts, assess confidence'
+    ]
+})
+
+# Content blocks are (kind, payload) pairs: kind names the st.* element to emit,
+# "dataframe" tables fill the container width, and "columns" holds one block list per column
+
+INTRO_BLOCKS = [
+    ("markdown", """
+    # 📚 Learning & Theory: GARCH & EGARCH Models
+    
+    ---
+    
+    ## 🎯 Overview
+    """),
+    ("info", """
+    This section explains the theoretical foundations of GARCH and EGARCH volatility models,
+    including their mathematical basis, assumptions, inputs, and practical interpretations.
+    """),
+]
+
+LEARNING_TABS = (
+    # GARCH EXPLANATION
+    ("📖 GARCH(1,1)", [
+        ("markdown", """
+        ## GARCH(1,1) Model - Generalized Autoregressive Conditional Heteroskedasticity
+        
+        ### 📐 Mathematical Formula
+        """),
+        ("latex", r"""
+        \sigma_t^2 = \omega + \alpha \epsilon_{t-1}^2 + \beta \sigma_{t-1}^2
+        """),
+        ("markdown", "### 🔑 Parameter Meanings"),
+        ("columns", [
+            [
+                ("markdown", """
+                #### ω (Omega)
+                **Constant term**
+                - Long-run average volatility
+                - Baseline volatility level
+                - Must be positive
+                """),
+            ],
+            [
+                ("markdown", """
+                #### α (Alpha)
+                **Shock coefficient**
+                - Measures immediate reaction to shocks
+                - Response to unexpected returns
+                - Range: 0 to 1
+                """),
+            ],
+            [
+                ("markdown", """
+                #### β (Beta)
+                **Persistence coefficient**
+                - Measures volatility persistence
+                - How quickly shocks fade
+                - Range: 0 to 1
+                """),
+            ],
+        ]),
+        ("markdown", """
+        ### 💼 Model Inputs
+        1. **Historical Returns:** Daily/weekly price changes
+        2. **Time Period:** Historical data for model training (e.g., 3 years)
+        3. **Forecast Horizon:** Future days to forecast volatility
+        
+        ### 📋 Key Assumptions
+        1. **Symmetric Response:** Positive and negative shocks have equal impact
+        2. **Mean Reversion:** Volatility reverts to long-run average
+        3. **Conditional Normality:** Returns follow normal distribution
+        4. **Constant Parameters:** Model coefficients are stable over time
+        5. **Stationarity:** Time series properties don't change over time
+        
+        ### ✨ Advantages
+        """),
+        ("success", """
+        ✅ **Simplicity:** Easy to understand and implement
+        ✅ **Interpretability:** Clear meaning of each parameter
+        ✅ **Effectiveness:** Works well for many financial series
+        ✅ **Computational Efficiency:** Fast to estimate and forecast
+        ✅ **Stability:** Stable estimates for most datasets
+        ✅ **Symmetric:** Good for markets without leverage effects
+        """),
+        ("markdown", "### ⚠️ Limitations"),
+        ("warning", """
+        ❌ **Symmetric Response:** Ignores leverage effect (negative shocks ≠ positive shocks)
+        ❌ **Parameter Constraints:** Both α and β must be <1 (restrictive)
+        ❌ **Slow Adaptation:** May not capture rapid volatility changes
+        ❌ **Mean Reversion:** Assumes volatility reverts to constant level
+        """),
+        ("markdown", """
+        ### 🎯 Best Use Cases
+        - **Commodities:** Gold, oil, agricultural products
+        - **Symmetric Markets:** Markets without leverage effect
+        - **Stable Periods:** When leverage effect is minimal
+        - **Quick Forecasts:** When speed and simplicity are priorities
+        """),
+    ]),
+    # EGARCH EXPLANATION
+    ("⚡ EGARCH(1,1)", [
+        ("markdown", """
+        ## EGARCH(1,1) Model - Exponential GARCH
+        
+        ### 📐 Mathematical Formula
+        """),
+        ("latex", r"""
+        \log(\sigma_t^2) = \omega + \alpha \frac{\epsilon_{t-1}}{|\sigma_{t-1}|} + \gamma \frac{\epsilon_{t-1}}{\sigma_{t-1}} + \beta \log(\sigma_{t-1}^2)
+        """),
+        ("markdown", "### 🔑 Parameter Meanings"),
+        ("columns", [
+            [
+                ("markdown", """
+                #### ω (Omega)
+                **Intercept**
+                - Baseline log-volatility
+                - Can be negative
+                """),
+            ],
+            [
+                ("markdown", """
+                #### α (Alpha)
+                **Shock magnitude**
+                - Symmetric response component
+                - Size effect
+                """),
+            ],
+            [
+                ("markdown", """
+                #### β (Beta)
+                **Persistence**
+                - Volatility clustering
+                - Memory effect
+                """),
+            ],
+            [
+                ("markdown", """
+                #### γ (Gamma)
+                **Leverage effect**
+                - Asymmetric response
+                - Good news ≠ Bad news
+                """),
+            ],
+        ]),
+        ("markdown", """
+        ### 💼 Model Inputs
+        1. **Historical Returns:** Daily/weekly price changes
+        2. **Time Period:** Historical data for model training (e.g., 3 years)
+        3. **Forecast Horizon:** Future days to forecast volatility
+        
+        ### 📋 Key Assumptions
+        1. **Asymmetric Response:** Negative shocks have larger impact (leverage effect)
+        2. **Log-Volatility Model:** Uses logarithm of variance (more stable)
+        3. **Mean Reversion:** Volatility reverts to long-run average
+        4. **Conditional Normality:** Returns follow normal distribution
+        5. **Stationarity:** Time series properties don't change over time
+        
+        ### ✨ Advantages
+        """),
+        ("success", """
+        ✅ **Leverage Effect:** Captures asymmetric response to shocks
+        ✅ **Log-Specification:** More stable, no negativity constraints
+        ✅ **Better Fit:** Often provides better fit than GARCH
+        ✅ **Realistic:** Reflects actual market behavior (bad news > good news)
+        ✅ **Flexibility:** No constraint that α+β<1
+        ✅ **Equity Markets:** Particularly good for stocks with leverage effects
+        """),
+        ("markdown", "### ⚠️ Limitations"),
+        ("warning", """
+        ❌ **Complexity:** More parameters and more difficult to interpret
+        ❌ **Convergence:** Sometimes hard to estimate reliably
+        ❌ **Gamma N/A:** Not all datasets show leverage effects
+        ❌ **Computational Cost:** Slower to estimate and forecast
+        ❌ **Parameter Identification:** Gamma may not be identified in some data
+        """),
+        ("markdown", """
+        ### 🎯 Best Use Cases
+        - **Equity Markets:** Stocks where bad news > good news effect
+        - **High Volatility Assets:** Where leverage effect is pronounced
+        - **Risk Management:** More accurate tail risk estimation
+        - **Option Pricing:** Better for modeling implied volatility
+        """),
+    ]),
+    # COMPARISON
+    ("🔬 Comparison", [
+        ("markdown", "## GARCH vs EGARCH: Side-by-Side Comparison"),
+        ("dataframe", MODEL_FEATURES_DF),
+        ("markdown", "### 📊 Model Selection Recommendation"),
+        ("columns", [
+            [
+                ("success", """
+                ### Choose GARCH When:
+                - ✅ Simplicity and speed matter
+                - ✅ No leverage effect visible
+                - ✅ Commodities or symmetric markets
+                - ✅ Quick preliminary analysis needed
+                - ✅ Stable convergence required
+                """),
+            ],
+            [
+                ("info", """
+                ### Choose EGARCH When:
+                - ⚡ Leverage effect is present
+                - ⚡ Better fit is more important
+                - ⚡ Equity/stock markets
+                - ⚡ Risk management focus
+                - ⚡ Can tolerate estimation complexity
+                """),
+            ],
+        ]),
+    ]),
+    # FORECASTING
+    ("📊 Forecasting", [
+        ("markdown", """
+        ## 🔮 Volatility Forecasting Process
+        
+        ### Step-by-Step Process
+        """),
+        ("write", FORECAST_STEPS_DF),
+        ("markdown", """
+        ### 📈 Forecast Methodology
+        **One-Step Ahead Forecasting:**
+        - Use last observed returns and volatility
+        - Generate forecast for next period
+        - Update with new information
+        
+        **Multi-Step Forecasting:**
+        - Use forecasted conditional volatility
+        - Volatility tends toward long-run average
+        - Uncertainty increases with forecast horizon
+        
+        ### 🎯 Model Fit Statistics
+        **AIC (Akaike Information Criterion):**
+        - Lower is better
+        - Penalizes model complexity
+        - Use for model comparison
+        
+        **BIC (Bayesian Information Criterion):**
+        - Lower is better
+        - Stronger penalty for complexity
+        - Preferred for model selection
+        
+        **Log-Likelihood:**
+        - Higher is better
+        - Goodness of fit measure
+        - Basis for information criteria
+        """),
+    ]),
+    # INTERPRETATION
+    ("💡 Interpretation", [
+        ("markdown", """
+        ## 💡 Interpretation & Practical Use
+        
+        ### Understanding the Parameters
+        #### ω (Omega) Interpretation
+        - **Meaning:** Long-run average volatility level
+        - **High ω:** Markets are naturally volatile
+        - **Low ω:** Markets are stable
+        - **Example:** ω=0.05 means 5% baseline daily volatility
+        
+        #### α (Alpha) Interpretation
+        - **High α (0.1-0.3):** Quick response to shocks
+        - **Low α (0.01-0.05):** Slow response to shocks
+        - **Example:** α=0.15 means 15% of yesterday's shock enters today's volatility
+        
+        #### β (Beta) Interpretation
+        - **High β (0.8-0.95):** Volatility is persistent
+        - **Low β (0.3-0.6):** Volatility quickly reverts to mean
+        - **Example:** β=0.85 means 85% of yesterday's volatility stays today
+        
+        #### γ (Gamma) EGARCH Interpretation
+        - **Positive γ:** Negative shocks increase volatility more
+        - **Magnitude of γ:** Strength of leverage effect
+        - **Example:** γ=0.15 means asymmetry is moderate
+        - **Note:** Often N/A for some datasets (means no leverage effect)
+        
+        ### Reading Forecast Results
+        **Volatility Forecast Values:**
+        - **Higher volatility forecast:** Market expects higher uncertainty
+        - **Lower volatility forecast:** Market expects stability
+        - **Increasing trend:** Shocks are accumulating
+        - **Decreasing trend:** Volatility reverting to mean
+        
+        **Using Forecasts:**
+        1. **Risk Management:** Set wider stop-losses for high volatility
+        2. **Options Trading:** Higher volatility → higher option premiums
+        3. **Portfolio Allocation:** Adjust asset weights based on volatility
+        4. **Hedging:** More hedging needed in high volatility periods
+        
+        ### Practical Guidance
+        """),
+        ("columns", [
+            [
+                ("markdown", """
+                #### For Traders
+                - **Rising volatility:** Consider reducing position sizes
+                - **Falling volatility:** May signal reversal opportunity
+                - **Forecast accuracy:** Improves near-term (1-5 days)
+                - **Confidence:** Declines for longer horizons
+                """),
+            ],
+            [
+                ("markdown", """
+                #### For Risk Managers
+                - **VaR Calculation:** Use model-based volatility
+                - **Margin Requirements:** Adjust based on forecasts
+                - **Stress Testing:** Scenario analysis with high volatility
+                - **Monitoring:** Watch α for shock sensitivity
+                """),
+            ],
+        ]),
+        ("markdown", "### ⚠️ Important Reminders"),
+        ("warning", """
+        - **Past volatility ≠ Future volatility:** Use forecasts cautiously
+        - **Model assumptions may not hold:** Test regularly
+        - **Structural breaks:** Models struggle with regime changes
+        - **Tail events:** Models underestimate extreme moves
+        - **Combine with analysis:** Don't rely solely on quantitative models
+        """),
+    ]),
+)
+
+
+def render_blocks(blocks):
+    """Emit a list of (kind, payload) content blocks"""
+    for kind, payload in blocks:
+        if kind == "columns":
+            for column, column_blocks in zip(st.columns(len(payload)), payload):
+                with column:
+                    render_blocks(column_blocks)
+        elif kind == "dataframe":
+            st.dataframe(payload, use_container_width=True)
+        else:
+            getattr(st, kind)(payload)
+
+
+def render_learning_tab():
+    """Learning & Theory tab: intro blocks, then one sub-tab per model topic"""
+    render_blocks(INTRO_BLOCKS)
+    
+    tabs = st.tabs([title for title, _ in LEARNING_TABS])
+    for tab, (_, blocks) in zip(tabs, LEARNING_TABS):
+        with tab:
+            render_blocks(blocks)
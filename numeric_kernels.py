@@ -0,0 +1,100 @@
+"""
+Numeric Kernels Module
+Fused per-rerun data preparation, JIT-compiled with Numba when it is installed
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # optional accelerator - callers fall back to the NumPy/pandas path
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (bare or with options)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Explicit signature: compiled eagerly for the one input type the app ever passes
+# (writable C-contiguous float64 prices - read-only arrays do not match), so calls skip Numba's type dispatch
+PREPARE_RETURNS_SIGNATURE = (
+    "Tuple((float64[::1], float64[::1], float64, float64, float64, float64, float64, float64, float64))"
+    "(float64[::1], int64)"
+)
+
+
+@njit(PREPARE_RETURNS_SIGNATURE, cache=True)
+def prepare_returns(close, window):
+    """
+    Log-returns (%), rolling volatility and return moments in a single pass
+
+    Args:
+        close: C-contiguous float64 array of close prices (NaN-free)
+        window: rolling-volatility window (e.g. 20 days)
+
+    Returns:
+        (returns, rolling_vol, mean, std, skew, kurt, min, max, rolling_vol_mean) -
+        rolling_vol is NaN for the first window-1 points (and left out of its mean),
+        std uses ddof=1, and skew/kurt are the bias-corrected sample estimators
+        (same as pandas / describe(bias=False))
+    """
+    n = close.size - 1
+    returns = np.empty(n)
+    rolling_vol = np.full(n, np.nan)
+
+    # Running central moments (Welford / Terriberry updates)
+    mean = 0.0
+    m2 = 0.0
+    m3 = 0.0
+    m4 = 0.0
+    lo = np.inf
+    hi = -np.inf
+
+    # Sliding-window mean / sum of squared deviations
+    w_mean = 0.0
+    w_m2 = 0.0
+    vol_sum = 0.0
+
+    for i in range(n):
+        x = math.log(close[i + 1] / close[i]) * 100.0
+        returns[i] = x
+
+        k = i + 1.0
+        delta = x - mean
+        delta_k = delta / k
+        delta_k2 = delta_k * delta_k
+        term = delta * delta_k * (k - 1.0)
+        mean += delta_k
+        m4 += term * delta_k2 * (k * k - 3.0 * k + 3.0) + 6.0 * delta_k2 * m2 - 4.0 * delta_k * m3
+        m3 += term * delta_k * (k - 2.0) - 3.0 * delta_k * m2
+        m2 += term
+        lo = min(lo, x)
+        hi = max(hi, x)
+
+        if i < window:
+            d = x - w_mean
+            w_mean += d / k
+            w_m2 += d * (x - w_mean)
+        else:
+            old = returns[i - window]
+            new_mean = w_mean + (x - old) / window
+            w_m2 += (x - old) * (x - new_mean + old - w_mean)
+            w_mean = new_mean
+        if i >= window - 1:
+            vol = math.sqrt(max(w_m2, 0.0) / (window - 1))
+            rolling_vol[i] = vol
+            vol_sum += vol
+
+    std = math.sqrt(m2 / (n - 1))
+    g1 = math.sqrt(n) * m3 / m2 ** 1.5
+    g2 = n * m4 / (m2 * m2) - 3.0
+    skew = g1 * math.sqrt(n * (n - 1.0)) / (n - 2.0)
+    kurt = ((n + 1.0) * g2 + 6.0) * (n - 1.0) / ((n - 2.0) * (n - 3.0))
+
+    rolling_vol_mean = vol_sum / (n - window + 1) if n >= window else np.nan
+
+    return returns, rolling_vol, mean, std, skew, kurt, lo, hi, rolling_vol_mean
@@ -0,0 +1,68 @@
+"""
+Price Cache Module
+On-disk Parquet cache of downloaded prices, so a cold restart skips Yahoo Finance
+"""
+
+import logging
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+import pandas as pd
+
+from atomic_write import write_atomic
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(__file__).resolve().parent / ".pricecache"
+MAX_AGE_SECONDS = 24 * 3600  # daily bars - a day-old download is still current enough
+
+
+def _entry_path(symbol: str, years: int) -> Path:
+    """Cache file for one (symbol, years) download"""
+    return CACHE_DIR / f"{symbol}_{years}y.parquet"
+
+
+def invalidate(symbol: str, years: int) -> None:
+    """Drop the stored prices for (symbol, years), so the next load re-downloads them"""
+    try:
+        _entry_path(symbol, years).unlink(missing_ok=True)
+    except Exception as e:
+        logger.warning("Could not remove price cache entry for %s: %s", symbol, e)
+
+
+def load_or_fetch(symbol: str, years: int,
+                  fetch_fn: Callable[[], Optional[pd.DataFrame]]) -> Optional[pd.DataFrame]:
+    """
+    Return the stored prices for (symbol, years) if fresher than MAX_AGE_SECONDS,
+    otherwise run fetch_fn and store its result
+
+    Args:
+        symbol: Yahoo Finance symbol
+        years: history length in years
+        fetch_fn: zero-argument callable downloading the prices on a miss
+
+    Returns:
+        The cached or freshly fetched DataFrame (None if the fetch failed - failures
+        are not cached). Disk errors never fail the load.
+    """
+    path = _entry_path(symbol, years)
+
+    try:
+        if time.time() - path.stat().st_mtime < MAX_AGE_SECONDS:
+            return pd.read_parquet(path)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning("Discarding unreadable price cache entry %s: %s", path.name, e)
+
+    data = fetch_fn()
+    if data is None:
+        return None
+
+    try:
+        write_atomic(path, lambda tmp_path: data.to_parquet(tmp_path, compression="zstd"))
+    except Exception as e:
+        logger.warning("Could not persist price cache entry %s: %s", path.name, e)
+
+    return data
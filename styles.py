@@ -14,6 +14,8 @@ Usage:
     st.markdown(get_hero_header_html(...), unsafe_allow_html=True)
 """
 
+import functools
+import re
 import streamlit as st
 from config import COLORS, TYPOGRAPHY, SIDEBAR_CONFIG, HERO_HEADER, METRIC_CARD, BUTTONS, FOOTER_CONFIG, SPACING
 
@@ -311,9 +313,14 @@ def get_sidebar_css() -> str:
     """
 
 def get_hero_css() -> str:
-    """Hero header styling"""
+    """Hero header styling (sizes are custom properties, so breakpoints only reset variables)"""
     return f"""
     .hero-title {{
+        --hero-emoji-size: {HERO_HEADER['emoji_size']};
+        --hero-title-size: {HERO_HEADER['title_font_size']};
+        --hero-title-spacing: {HERO_HEADER['title_letter_spacing']};
+        --hero-subtitle-size: {HERO_HEADER['subtitle_font_size']};
+        --hero-description-size: {HERO_HEADER['description_font_size']};
         background: {HERO_HEADER['background_gradient']};
         padding: {HERO_HEADER['padding']};
         border-radius: {HERO_HEADER['border_radius']};
@@ -328,7 +335,7 @@ def get_hero_css() -> str:
     }}
     
     .mountain-emoji {{
-        font-size: {HERO_HEADER['emoji_size']};
+        font-size: var(--hero-emoji-size);
         flex-shrink: 0;
         animation: float 3s ease-in-out infinite;
         text-shadow: 0 4px 10px rgba(0, 0, 0, 0.3);
@@ -340,17 +347,17 @@ def get_hero_css() -> str:
     }}
     
     .hero-text-right h1 {{
-        font-size: {HERO_HEADER['title_font_size']};
+        font-size: var(--hero-title-size);
         font-weight: {HERO_HEADER['title_font_weight']};
         color: {HERO_HEADER['title_color']};
         margin: 0.05rem 0;
         text-shadow: 2px 2px 8px rgba(0, 0, 0, 0.5);
-        letter-spacing: {HERO_HEADER['title_letter_spacing']};
+        letter-spacing: var(--hero-title-spacing);
         line-height: 1;
     }}
     
     .hero-text-right p:first-of-type {{
-        font-size: {HERO_HEADER['subtitle_font_size']};
+        font-size: var(--hero-subtitle-size);
         color: {HERO_HEADER['subtitle_color']};
         margin: 0.3rem 0 0.2rem 0;
         font-weight: {HERO_HEADER['subtitle_font_weight']};
@@ -358,7 +365,7 @@ def get_hero_css() -> str:
     }}
     
     .hero-text-right p:last-of-type {{
-        font-size: {HERO_HEADER['description_font_size']};
+        font-size: var(--hero-description-size);
         color: {HERO_HEADER['description_color']};
         margin: 0.2rem 0 0;
         font-weight: {TYPOGRAPHY['normal']};
@@ -506,6 +513,11 @@ def get_responsive_css() -> str:
     /* Tablet (768px) */
     @media (max-width: 768px) {{
         .hero-title {{
+            --hero-emoji-size: 80px;
+            --hero-title-size: 24px;
+            --hero-title-spacing: 1px;
+            --hero-subtitle-size: 18px;
+            --hero-description-size: 12px;
             flex-direction: column;
             text-align: center;
             padding: 1.5rem 1.5rem;
@@ -515,27 +527,9 @@ def get_responsive_css() -> str:
         }}
         
         .mountain-emoji {{
-            font-size: 80px;
             margin: 0;
         }}
         
-        .hero-text-right {{
-            text-align: center;
-        }}
-        
-        .hero-text-right h1 {{
-            font-size: 24px;
-            letter-spacing: 1px;
-        }}
-        
-        .hero-text-right p:first-of-type {{
-            font-size: 18px;
-        }}
-        
-        .hero-text-right p:last-of-type {{
-            font-size: 12px;
-        }}
-        
         h1 {{
             font-size: 32px;
         }}
@@ -552,22 +546,13 @@ def get_responsive_css() -> str:
     /* Mobile (480px) */
     @media (max-width: 480px) {{
         .hero-title {{
+            --hero-emoji-size: 70px;
+            --hero-title-size: 20px;
+            --hero-subtitle-size: 16px;
             padding: 1rem;
             max-width: 100%;
         }}
         
-        .mountain-emoji {{
-            font-size: 70px;
-        }}
-        
-        .hero-text-right h1 {{
-            font-size: 20px;
-        }}
-        
-        .hero-text-right p:first-of-type {{
-            font-size: 16px;
-        }}
-        
         h1 {{
             font-size: 24px;
         }}
@@ -612,8 +597,13 @@ def get_animations_css() -> str:
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # HTML COMPONENT GENERATORS
+# Pure functions of hashable arguments - memoized, since reruns repeat the same calls
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Accent color resolved once for the card templates below
+_ACCENT = COLORS['accent_gold']
+
+@functools.lru_cache(maxsize=256)
 def get_hero_header_html(
     title: str,
     subtitle: str,
@@ -643,6 +633,7 @@ def get_hero_header_html(
     </div>
     """
 
+@functools.lru_cache(maxsize=256)
 def get_metric_card_html(
     title: str,
     value: str,
@@ -668,11 +659,70 @@ def get_metric_card_html(
     <div class="{css_class}">
         <div style="font-size: 24px; margin-bottom: 0.5rem;">{emoji}</div>
         <strong>{title}</strong>
-        <div style="font-size: 18px; color: {COLORS['accent_gold']}; margin-top: 0.5rem;">{value}</div>
+        <div style="font-size: 18px; color: {_ACCENT}; margin-top: 0.5rem;">{value}</div>
         <small>{description}</small>
     </div>
     """
 
+@functools.lru_cache(maxsize=32)
+def get_single_metric_html(title: str, value: str, description: str = "") -> str:
+    """
+    Generate a single highlighted metric card, centered at half width
+    
+    Args:
+        title: Metric title
+        value: Main metric value (shown in gold)
+        description: Description text
+    
+    Returns:
+        HTML string
+    """
+    return f"""
+    <div style="
+        max-width: 50%;
+        margin: 0 auto;
+        background: linear-gradient(135deg, #003d70 0%, #005a9d 100%);
+        padding: 2rem;
+        border-radius: 15px;
+        text-align: center;
+        color: white;
+    ">
+        <h3 style="color: white; margin: 0;">{title}</h3>
+        <h1 style="color: {_ACCENT}; margin: 0.5rem 0;">{value}</h1>
+        <p style="color: white; margin: 0; font-size: 12px;">{description}</p>
+    </div>
+    """
+
+@functools.lru_cache(maxsize=256)
+def get_card_html(
+    title: str,
+    content: str,
+    icon: str = "📊",
+    highlight: bool = False
+) -> str:
+    """
+    Generate content card HTML (no blank lines, so cards can be joined into one HTML block)
+    
+    Args:
+        title: Card title
+        content: Card body text
+        icon: Emoji shown before the title
+        highlight: If True, adds gold border
+    
+    Returns:
+        HTML string
+    """
+    border = f" border: 2px solid {_ACCENT};" if highlight else ""
+    return f"""<div style="
+        background: linear-gradient(135deg, #003d70 0%, #005a9d 100%);{border}
+        padding: 1.5rem;
+        border-radius: 15px;
+        color: white;
+    ">
+        <h3 style="color: white; margin-top: 0;">{icon} {title}</h3>
+        <p style="color: white;">{content}</p>
+    </div>"""
+
 def get_primary_button_html(
     text: str,
     url: str = "#",
@@ -714,11 +764,15 @@ def get_footer_html(
     Returns:
         HTML string
     """
-    social_links = social_links or {}
-    
+    # dicts aren't hashable - key the cache on the (name, url) pairs instead
+    return _footer_html(title, description, author, tuple((social_links or {}).items()))
+
+@functools.lru_cache(maxsize=256)
+def _footer_html(title: str, description: str, author: str, social_links: tuple) -> str:
+    """get_footer_html body, memoized on the social links as (name, url) pairs"""
     social_html = ""
     if social_links:
-        for name, url in social_links.items():
+        for name, url in social_links:
             if name == "LinkedIn":
                 icon_emoji = "🔗"
                 bg_color = "#0077B5"
@@ -778,6 +832,13 @@ def get_gradient(start_color: str, end_color: str, angle: int = 135) -> str:
     """Get gradient CSS. Usage: get_gradient('primary_dark', 'primary_light')"""
     return f"linear-gradient({angle}deg, {start_color} 0%, {end_color} 100%)"
 
+def minify_css(css: str) -> str:
+    """Strip comments and layout whitespace from a static stylesheet. Usage: minify_css(CSS) at import"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};>,])\s*", r"\1", css)
+    return re.sub(r":\s+", ":", css).replace(" !important", "!important").strip()
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # HOW TO USE THESE FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════════════════
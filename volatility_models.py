@@ -9,44 +9,102 @@ Proper pandas Series handling + Comprehensive parameter extraction
 import numpy as np
 import pandas as pd
 from arch import arch_model
-from typing import Tuple
+from typing import Optional, Tuple
+import logging
 import warnings
+from fast_garch import fit_egarch11_fast, fit_garch11_fast
 warnings.filterwarnings('ignore')
 
+logger = logging.getLogger(__name__)
+
 class VolatilityModels:
     
+    @staticmethod
+    def _prepare_returns(returns: pd.Series) -> pd.Series:
+        """
+        Drop NaNs and pin the fit input to float64
+        
+        arch's variance recursions are compiled for double precision only, so a
+        float32 series would just be upcast (with a copy) inside arch_model.
+        Reduced precision is reserved for the display paths in app.py.
+        """
+        # dropna() always copies - only pay for it when there is something to drop
+        returns_clean = returns.dropna() if returns.hasnans else returns
+        returns_clean = returns_clean.astype(np.float64, copy=False)
+        
+        if len(returns_clean) < 50:
+            raise ValueError(f"Insufficient data: {len(returns_clean)} observations")
+        
+        return returns_clean
+    
+    @staticmethod
+    def _default_starting_values(returns_clean: pd.Series, vol: str) -> np.ndarray:
+        """
+        Typical daily-data estimates as the optimizer starting point: [mu, omega, alpha, beta]
+        
+        GARCH: alpha + beta = 0.99, omega = var * (1 - alpha - beta), so the implied
+        unconditional variance matches the sample variance.
+        EGARCH: beta = 0.95, omega = log(var) * (1 - beta), so the implied unconditional
+        log-variance omega / (1 - beta) matches the log sample variance.
+        """
+        mean = returns_clean.mean()
+        var = returns_clean.var()
+        if vol == 'EGarch':
+            return np.array([mean, np.log(var) * (1 - 0.95), 0.1, 0.95])
+        return np.array([mean, var * (1 - 0.09 - 0.9), 0.09, 0.9])
+    
     @staticmethod
     def print_all_params(results, model_name=""):
-        """Debug function to print all available parameters"""
-        print(f"\n{'='*70}")
-        print(f"DEBUG: All Parameters for {model_name}")
-        print(f"{'='*70}")
-        print(f"Parameter names: {list(results.params.index)}")
-        print(f"\nParameter values:")
+        """Debug dump of all estimated parameters (logged only when DEBUG is enabled)"""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug("All parameters for %s: %s", model_name, list(results.params.index))
         for name in results.params.index:
             val = results.params[name]
             se = results.std_err[name] if name in results.std_err else np.nan
-            print(f"  {name:20s} = {val:12.8f} (SE: {se:10.8f})")
-        print(f"{'='*70}\n")
+            logger.debug("  %-20s = %12.8f (SE: %10.8f)", name, val, se)
     
     @staticmethod
-    def fit_garch(returns: pd.Series, p: int = 1, q: int = 1, forecast_periods: int = 20) -> Tuple:
-        """Fit GARCH(1,1) model and generate forecasts"""
+    def fit_garch(
+        returns: pd.Series,
+        p: int = 1,
+        q: int = 1,
+        forecast_periods: int = 20,
+        starting_values: Optional[np.ndarray] = None
+    ) -> Tuple:
+        """
+        Fit GARCH(1,1) model and generate forecasts
+        
+        starting_values (e.g. the params of a previous fit on the same asset) warm-start
+        the optimizer; arch ignores them if they violate the model constraints.
+        Without them a GARCH(1,1) fit starts from typical daily-data estimates.
+        With Numba installed the GARCH(1,1) MLE is first located on the compiled
+        likelihood in fast_garch, so arch only polishes it and computes std errors.
+        """
         try:
             # KEEP AS PANDAS SERIES
-            returns_clean = returns.dropna()
-            
-            if len(returns_clean) < 50:
-                raise ValueError(f"Insufficient data: {len(returns_clean)} observations")
+            returns_clean = VolatilityModels._prepare_returns(returns)
             
             model = arch_model(returns_clean, vol='Garch', p=p, q=q, rescale=False)
+            if p == 1 and q == 1:
+                if starting_values is None:
+                    starting_values = VolatilityModels._default_starting_values(returns_clean, 'Garch')
+                fast_params = fit_garch11_fast(returns_clean.to_numpy(), starting_values)
+                if fast_params is not None:
+                    starting_values = fast_params
             
             try:
-                results = model.fit(disp='off', show_warning=False, options={'maxiter': 1000})
+                results = model.fit(
+                    disp='off',
+                    update_freq=0,
+                    show_warning=False,
+                    starting_values=starting_values,
+                    options={'maxiter': 1000}
+                )
             except:
-                results = model.fit(disp='off', show_warning=False)
+                results = model.fit(disp='off', update_freq=0, show_warning=False)
             
-            # Debug print
+            # Debug dump (no-op unless DEBUG logging is on)
             VolatilityModels.print_all_params(results, "GARCH")
             
             try:
@@ -61,27 +119,50 @@ class VolatilityModels:
             return results, forecast_volatility
             
         except Exception as e:
-            print(f"GARCH Error: {str(e)}")
+            logger.error("GARCH Error: %s", e)
             raise
     
     @staticmethod
-    def fit_egarch(returns: pd.Series, p: int = 1, q: int = 1, forecast_periods: int = 20) -> Tuple:
-        """Fit EGARCH(1,1) model and generate forecasts"""
+    def fit_egarch(
+        returns: pd.Series,
+        p: int = 1,
+        q: int = 1,
+        forecast_periods: int = 20,
+        starting_values: Optional[np.ndarray] = None
+    ) -> Tuple:
+        """
+        Fit EGARCH(1,1) model and generate forecasts
+        
+        starting_values (e.g. the params of a previous fit on the same asset) warm-start
+        the optimizer; arch ignores them if they violate the model constraints.
+        Without them an EGARCH(1,1) fit starts from typical daily-data estimates.
+        With Numba installed the EGARCH(1,1) MLE is first located on the compiled
+        likelihood in fast_garch, so arch only polishes it and computes std errors.
+        """
         try:
             # KEEP AS PANDAS SERIES
-            returns_clean = returns.dropna()
-            
-            if len(returns_clean) < 50:
-                raise ValueError(f"Insufficient data: {len(returns_clean)} observations")
+            returns_clean = VolatilityModels._prepare_returns(returns)
             
             model = arch_model(returns_clean, vol='EGarch', p=p, q=q, rescale=False)
+            if p == 1 and q == 1:
+                if starting_values is None:
+                    starting_values = VolatilityModels._default_starting_values(returns_clean, 'EGarch')
+                fast_params = fit_egarch11_fast(returns_clean.to_numpy(), starting_values)
+                if fast_params is not None:
+                    starting_values = fast_params
             
             try:
-                results = model.fit(disp='off', show_warning=False, options={'maxiter': 1000})
+                results = model.fit(
+                    disp='off',
+                    update_freq=0,
+                    show_warning=False,
+                    starting_values=starting_values,
+                    options={'maxiter': 1000}
+                )
             except:
-                results = model.fit(disp='off', show_warning=False)
+                results = model.fit(disp='off', update_freq=0, show_warning=False)
             
-            # Debug print
+            # Debug dump (no-op unless DEBUG logging is on)
             VolatilityModels.print_all_params(results, "EGARCH")
             
             try:
@@ -96,7 +177,7 @@ class VolatilityModels:
             return results, forecast_volatility
             
         except Exception as e:
-            print(f"EGARCH Error: {str(e)}")
+            logger.error("EGARCH Error: %s", e)
             raise
     
     @staticmethod
@@ -119,9 +200,39 @@ class VolatilityModels:
                 }
             }
         except Exception as e:
-            print(f"Comparison Error: {str(e)}")
+            logger.error("Comparison Error: %s", e)
             return None
     
+    @staticmethod
+    def compute_acf(x, nlags: int = 40, squared: bool = False) -> np.ndarray:
+        """
+        Sample autocorrelation up to nlags via FFT (Wiener-Khinchin), O(N log N)
+        
+        squared=True gives the ACF of x**2 - the squares are written into the same
+        buffer that gets demeaned, so no separate squared-returns array is built.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        if squared:
+            x = np.square(x)
+            x -= x.mean()
+        else:
+            x = x - x.mean()
+        n = x.size
+        
+        # Zero-pad to a power of two >= 2N-1 so the circular correlation doesn't wrap
+        nfft = 1 << (2 * n - 1).bit_length()
+        spectrum = np.fft.rfft(x, n=nfft)
+        acov = np.fft.irfft(spectrum * np.conj(spectrum), n=nfft)[:nlags + 1]
+        return acov / acov[0]
+    
+    @staticmethod
+    def _match_param(lookup: dict, names) -> Optional[str]:
+        """First real parameter name whose lower-cased form contains any of names"""
+        for key_lower, key in lookup.items():
+            if any(name in key_lower for name in names):
+                return key
+        return None
+    
     @staticmethod
     def extract_model_parameters(results) -> dict:
         """Extract model parameters - handles all parameter names"""
@@ -129,89 +240,47 @@ class VolatilityModels:
             params = results.params
             std_err = results.std_err
             
-            print(f"\nEXTRACTING PARAMETERS FROM {len(params)} available parameters")
-            print(f"Available parameter names: {list(params.index)}")
-            
-            # Get Omega
-            omega = None
-            omega_se = None
-            omega_key = None
-            
-            for key in ['Constant', 'const', 'mu', 'omega']:
-                if key in params:
-                    omega = float(params[key])
-                    omega_se = float(std_err[key])
-                    omega_key = key
-                    print(f"✓ Found Omega as: {key}")
-                    break
-            
-            if omega is None and len(params) > 0:
-                try:
-                    omega = float(params.iloc[0])
-                    omega_se = float(std_err.iloc[0])
-                    omega_key = params.index[0]
-                    print(f"✓ Found Omega as first parameter: {omega_key}")
-                except:
-                    pass
-            
-            # Get Alpha
-            alpha = None
-            alpha_se = None
-            for key in params.index:
-                if 'alpha' in str(key).lower():
-                    alpha = float(params[key])
-                    alpha_se = float(std_err[key])
-                    print(f"✓ Found Alpha as: {key}")
-                    break
-            
-            # Get Beta
-            beta = None
-            beta_se = None
-            for key in params.index:
-                if 'beta' in str(key).lower():
-                    beta = float(params[key])
-                    beta_se = float(std_err[key])
-                    print(f"✓ Found Beta as: {key}")
-                    break
-            
-            # Get Gamma - COMPREHENSIVE SEARCH
-            gamma = None
-            gamma_se = None
-            gamma_found = False
-            
-            print(f"\nSearching for Gamma parameter...")
-            for key in params.index:
-                key_lower = str(key).lower()
-                print(f"  Checking: {key} (lower: {key_lower})")
-                
-                # Try all possible gamma-related names
-                gamma_names = ['gamma', 'leverage', 'asymmetry', 'skew', 'news', 'arch_in_mean']
-                if any(gname in key_lower for gname in gamma_names):
-                    try:
-                        gamma = float(params[key])
-                        gamma_se = float(std_err[key])
-                        print(f"✓ Found Gamma as: {key} = {gamma}")
-                        gamma_found = True
-                        break
-                    except Exception as e:
-                        print(f"  Error extracting {key}: {e}")
-                        continue
-            
-            if not gamma_found:
-                print(f"✗ Gamma parameter not found in results")
-                print(f"  Total parameters: {len(params)}")
-                print(f"  Parameter list: {list(params.index)}")
+            logger.debug("Extracting from %d available parameters: %s", len(params), params.index)
             
-            return {
-                "omega": omega,
-                "omega_se": omega_se,
-                "alpha": alpha,
-                "alpha_se": alpha_se,
-                "beta": beta,
-                "beta_se": beta_se,
-                "gamma": gamma,
-                "gamma_se": gamma_se,
+            # Lower-cased name -> real name, built once and shared by every lookup below
+            lookup = {str(key).lower(): key for key in params.index}
+            
+            # Omega keeps its name priority list (now case-insensitive), falling back to the first parameter
+            omega_key = next(
+                (lookup[name] for name in ('constant', 'const', 'mu', 'omega') if name in lookup),
+                params.index[0] if len(params) > 0 else None
+            )
+            if omega_key is not None:
+                logger.debug("Found Omega as: %s", omega_key)
+            
+            found = {
+                "omega": omega_key,
+                "alpha": VolatilityModels._match_param(lookup, ('alpha',)),
+                "beta": VolatilityModels._match_param(lookup, ('beta',)),
+                # Try all possible gamma-related names
+                "gamma": VolatilityModels._match_param(
+                    lookup, ('gamma', 'leverage', 'asymmetry', 'skew', 'news', 'arch_in_mean')
+                ),
             }
+            
+            if found["gamma"] is None:
+                logger.debug("Gamma parameter not found in results: %s", params.index)
+            
+            # One reindex per series pulls every resolved coefficient / std error at once
+            keys = [key for key in found.values() if key is not None]
+            coefs = params.reindex(keys).to_numpy(dtype=float)
+            ses = std_err.reindex(keys).to_numpy(dtype=float)
+            
+            extracted = {}
+            position = 0
+            for name, key in found.items():
+                if key is None:
+                    extracted[name] = extracted[f"{name}_se"] = None
+                else:
+                    extracted[name] = float(coefs[position])
+                    extracted[f"{name}_se"] = float(ses[position])
+                    position += 1
+            return extracted
         except Exception as e:
-            print(f"Parameter extraction error: {str(e)}")
+            logger.error("Parameter extraction error: %s", e)
             return {}